@@ -3,109 +3,288 @@
 Debug script for testing audio processing timing and speech detection.
 """
 
+import atexit
+import math
 import os
+import queue
 import sys
+import threading
 import time
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import numpy as np
+import pyaudio
 from dotenv import load_dotenv
 
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from assistant_agent import InterviewAssistant
 
+# Plain ASCII tags for per-chunk debug records; emoji are kept for once-per-utterance lines
+LOG_PREFIXES = {
+    "speech_on": "SPEECH",
+    "silence_on": "SIL",
+    "progress": "PROGRESS",
+}
+
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _energy_exceeds(samples, threshold_sq_n):
+        """Sum of squares of an int16 chunk against the scaled threshold, in one compiled loop."""
+        energy = 0.0
+        for value in samples:
+            energy += float(value) * float(value)
+        return energy > threshold_sq_n
+
+
+def _find_utterance_end(flags, silence_frames: int, min_frames: int):
+    """Return the frame count that closes the first complete utterance in flags, or None.
+    
+    An utterance closes once at least silence_frames silent frames follow a speech frame
+    and the utterance is at least min_frames long.
+    """
+    speech = np.flatnonzero(flags)
+    if not speech.size:
+        return None
+    
+    # Silent frames following each speech frame (up to the next speech frame or the end)
+    runs = np.diff(speech, append=len(flags)) - 1
+    ends = np.maximum(speech + silence_frames + 1, min_frames)
+    closed = speech + 1 + runs >= ends
+    hit = int(np.argmax(closed))
+    return int(ends[hit]) if closed[hit] else None
+
 
 class DebugInterviewAssistant(InterviewAssistant):
     """Debug version with enhanced logging."""
     
     def __init__(self):
-        # Set debug logging
-        logging.basicConfig(level=logging.DEBUG)
+        # Set debug logging; records are formatted and written on a listener thread so the
+        # audio threads only pay for an enqueue
+        log_queue = queue.Queue(-1)
+        console = logging.StreamHandler()
+        console.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+        self._log_listener = QueueListener(log_queue, console)
+        self._log_listener.start()
+        atexit.register(self._log_listener.stop)
+        
+        root = logging.getLogger()
+        root.setLevel(logging.DEBUG)
+        root.addHandler(QueueHandler(log_queue))
         super().__init__()
+        
+        # The debug loop exists to trace utterance endpointing, so always use batch recognition
+        self.use_streaming = False
+        # The debug rings are fed from the PyAudio stream callback
+        self.use_rtmixer = False
+        
+        # RMS threshold squared and scaled by the samples per chunk, so the VAD compares the
+        # raw sum of squares without a mean, sqrt or per-chunk rescale
+        samples_per_chunk = self.chunk_size * self.channels
+        self._vad_threshold_sq_n = (self.min_audio_level * 32767) ** 2 * samples_per_chunk
+        # int32 scratch for the squared samples; only the VAD worker thread touches it
+        self._vad_scratch = np.empty(samples_per_chunk, dtype=np.int32)
+        
+        # Structure-of-arrays ring: raw PCM and one VAD flag per frame, both indexed by frame id.
+        # Sized for two max-length utterances so capture keeps running while one is processed.
+        self._chunk_bytes = self.chunk_size * self.channels * 2
+        self._chunk_sec = self.chunk_size / self.sample_rate
+        self._ring_frames = 2 * math.ceil(self.max_speech_duration / self._chunk_sec) + 1
+        self._pcm_ring = bytearray(self._ring_frames * self._chunk_bytes)
+        self._pcm_view = memoryview(self._pcm_ring)
+        self._vad_ring = np.zeros(self._ring_frames, dtype=np.uint8)
+        self._write_idx = 0  # id of the next PCM frame; only the stream callback advances it
+        self._vad_idx = 0    # id of the next frame to classify; only the VAD worker advances it
+        self._pcm_ready = threading.Condition()
+        self._frame_event = threading.Event()
+        self._vad_thread = None
+    
+    def start_interview_session(self):
+        """Start the session plus the dedicated VAD worker."""
+        super().start_interview_session()
+        if self.is_running and not (self._vad_thread and self._vad_thread.is_alive()):
+            self._vad_thread = threading.Thread(target=self._vad_worker, daemon=True)
+            self._vad_thread.start()
+    
+    def _audio_callback(self, in_data, frame_count, time_info, status):
+        """Copy PCM into the ring and hand the frame to the VAD worker."""
+        if self.is_running:
+            slot = self._write_idx % self._ring_frames
+            offset = slot * self._chunk_bytes
+            self._pcm_view[offset:offset + self._chunk_bytes] = in_data
+            with self._pcm_ready:
+                self._write_idx += 1
+                self._pcm_ready.notify()
+        return (None, pyaudio.paContinue)
+    
+    def _vad_worker(self):
+        """Classify frames from the PCM ring into the flag ring, off the capture loop's path."""
+        try:
+            # Pin to one core for predictable latency (Linux only; pid 0 is this thread)
+            os.sched_setaffinity(0, {max(os.sched_getaffinity(0))})
+        except (AttributeError, OSError):
+            pass
+        
+        # Bind loop invariants to locals to keep attribute lookups off the per-frame path
+        size = self._chunk_bytes
+        ring_frames = self._ring_frames
+        pcm_view = self._pcm_view
+        vad_ring = self._vad_ring
+        pcm_ready = self._pcm_ready
+        has_activity = self._has_audio_activity
+        
+        while self.is_running:
+            with pcm_ready:
+                pcm_ready.wait_for(lambda: self._vad_idx < self._write_idx, timeout=0.5)
+                write_idx = self._write_idx
+            
+            # Frames older than one ring length have already been overwritten
+            start = max(self._vad_idx, write_idx - ring_frames + 1)
+            for frame in range(start, write_idx):
+                slot = frame % ring_frames
+                offset = slot * size
+                vad_ring[slot] = has_activity(pcm_view[offset:offset + size])
+            
+            if write_idx != self._vad_idx:
+                self._vad_idx = write_idx
+                self._frame_event.set()
+    
+    def _ring_spans(self, start: int, end: int):
+        """Split frame ids [start, end) into at most two contiguous ring slot ranges."""
+        first = start % self._ring_frames
+        last = first + (end - start)
+        if last <= self._ring_frames:
+            return [(first, last)]
+        return [(first, self._ring_frames), (0, last - self._ring_frames)]
+    
+    def _read_flags(self, start: int, end: int):
+        """Copy the VAD flags for frame ids [start, end)."""
+        return np.concatenate([self._vad_ring[a:b] for a, b in self._ring_spans(start, end)])
+    
+    def _read_pcm(self, start: int, end: int) -> bytes:
+        """Copy the PCM for frame ids [start, end) into one contiguous buffer."""
+        size = self._chunk_bytes
+        return b''.join(self._pcm_view[a * size:b * size] for a, b in self._ring_spans(start, end))
+    
+    def _has_audio_activity(self, audio_chunk: bytes) -> bool:
+        """Vectorized voice activity detection on an int16 view of the chunk."""
+        samples = np.frombuffer(audio_chunk, dtype=np.int16)  # view, no copy
+        if not samples.size:
+            return False
+        
+        if HAS_NUMBA:
+            loud = _energy_exceeds(samples, self._vad_threshold_sq_n)
+        else:
+            # Integer energy: squares land in the preallocated int32 scratch (32767**2 fits),
+            # and the sum accumulates in int64 - no float conversion, no per-chunk allocation
+            squares = self._vad_scratch[:samples.size]
+            np.multiply(samples, samples, out=squares, dtype=np.int32)
+            loud = int(squares.sum(dtype=np.int64)) > self._vad_threshold_sq_n
+        if not loud:
+            return False
+        
+        # Only loud chunks pay for the zero crossing rate (speech vs noise)
+        zcr = np.count_nonzero(np.diff(np.signbit(samples))) / samples.size
+        return 0.01 < zcr < 0.3
     
     def _audio_capture_loop(self):
         """Enhanced debug version of audio capture loop."""
         self.logger.info("🔍 DEBUG: Starting audio capture loop")
         
+        # Durations in frames: endpointing runs on the flag ring, not on wall-clock timers
+        chunk_sec = self._chunk_sec
+        min_frames = math.ceil(self.min_speech_duration / chunk_sec)
+        max_frames = math.ceil(self.max_speech_duration / chunk_sec)
+        silence_frames = math.ceil(self.final_silence_threshold / chunk_sec)
+        
+        utterance_start = self._vad_idx
+        in_silence = True
+        last_log_sec = 0
+        
+        # Bind per-wakeup callables to locals
+        frame_event = self._frame_event
+        read_flags = self._read_flags
+        count_nonzero = np.count_nonzero
+        debug = self.logger.debug
+        
+        self.logger.info("🎤 DEBUG: Starting new audio collection session")
+        
         while self.is_running:
             try:
-                # Collect audio chunks for processing
-                audio_chunks = []
-                start_time = time.time()
-                last_speech_time = time.time()
-                has_speech = False
-                silence_start_time = None
-                chunk_count = 0
-                speech_chunk_count = 0
+                # Sleep until the VAD worker publishes classified frames
+                if not frame_event.wait(timeout=0.5):
+                    continue
+                frame_event.clear()
+                write_idx = self._vad_idx
                 
-                self.logger.info("🎤 DEBUG: Starting new audio collection session")
+                frames = write_idx - utterance_start
+                if self._write_idx - utterance_start >= self._ring_frames:
+                    self.logger.warning(
+                        "⚠️ DEBUG: Capture fell %d frames behind - dropping oldest audio", frames
+                    )
+                    utterance_start = write_idx - max_frames
+                    frames = max_frames
                 
-                # Continuously collect and analyze audio
-                while self.is_running:
-                    current_time = time.time()
-                    
-                    # Check for maximum duration timeout
-                    if current_time - start_time > self.max_speech_duration:
-                        if has_speech:
-                            self.logger.info(f"⏰ DEBUG: Max duration reached ({self.max_speech_duration}s) with {speech_chunk_count} speech chunks - processing")
-                            break
-                        else:
-                            self.logger.info(f"⏰ DEBUG: Max duration reached but no speech detected in {chunk_count} chunks - resetting")
-                            audio_chunks = []
-                            start_time = current_time
-                            chunk_count = 0
-                            continue
-                    
-                    # Get audio chunk if available
-                    if not self.audio_queue.empty():
-                        chunk = self.audio_queue.get()
-                        audio_chunks.append(chunk)
-                        chunk_count += 1
-                        
-                        # Check if this chunk has speech
-                        if self._has_audio_activity(chunk):
-                            last_speech_time = current_time
-                            has_speech = True
-                            speech_chunk_count += 1
-                            if silence_start_time is not None:
-                                silence_duration = current_time - silence_start_time
-                                self.logger.debug(f"🔊 DEBUG: Speech resumed after {silence_duration:.2f}s silence")
-                            silence_start_time = None  # Reset silence timer
-                        else:
-                            # This chunk is silence
-                            if silence_start_time is None and has_speech:
-                                silence_start_time = current_time  # Start tracking silence
-                                self.logger.debug(f"🔇 DEBUG: Silence started after {speech_chunk_count} speech chunks")
-                    
-                    # Check if we should process accumulated speech
-                    if has_speech:
-                        speech_duration = current_time - start_time
-                        
-                        if silence_start_time is not None:
-                            silence_duration = current_time - silence_start_time
-                            
-                            # Log progress every second
-                            if int(current_time) != int(current_time - 0.1):
-                                self.logger.debug(f"📊 DEBUG: Speech={speech_duration:.1f}s, Silence={silence_duration:.1f}s, Chunks={chunk_count}, Speech chunks={speech_chunk_count}")
-                            
-                            # Process if we have enough speech and sufficient final silence
-                            if (speech_duration >= self.min_speech_duration and 
-                                silence_duration >= self.final_silence_threshold):
-                                self.logger.info(f"✅ DEBUG: Processing - {speech_duration:.1f}s speech, {silence_duration:.1f}s silence, {speech_chunk_count} speech chunks")
-                                break
-                    
-                    time.sleep(0.05)  # Small delay to prevent excessive CPU usage
+                flags = read_flags(utterance_start, write_idx)
+                speech_chunk_count = int(count_nonzero(flags))
+                end = _find_utterance_end(flags, silence_frames, min_frames)
                 
-                # Process the collected audio if we have speech
-                if audio_chunks and has_speech:
-                    self.logger.info(f"🎯 DEBUG: Processing {len(audio_chunks)} total chunks ({speech_chunk_count} with speech)")
-                    audio_data = b''.join(audio_chunks)
-                    self._process_audio_chunk(audio_data)
+                if end is None and frames > max_frames:
+                    if not speech_chunk_count:
+                        self.logger.info(
+                            "⏰ DEBUG: Max duration reached but no speech detected in %d chunks"
+                            " - resetting", frames
+                        )
+                        utterance_start = write_idx
+                        continue
+                    self.logger.info("⏰ DEBUG: Max duration reached (%ss) with %d speech chunks"
+                                     " - processing", self.max_speech_duration, speech_chunk_count)
+                    end = frames
+                elif end is None:
+                    # Transition and progress tracing only matters when DEBUG records are emitted
+                    if speech_chunk_count and self.logger.isEnabledFor(logging.DEBUG):
+                        # Trailing silence run since the last speech frame
+                        silence_run = frames - 1 - int(np.flatnonzero(flags)[-1])
+                        if (silence_run > 0) != in_silence:
+                            in_silence = silence_run > 0
+                            if in_silence:
+                                debug("%s DEBUG: Silence started after %d speech chunks",
+                                      LOG_PREFIXES["silence_on"], speech_chunk_count)
+                            else:
+                                debug("%s DEBUG: Speech resumed", LOG_PREFIXES["speech_on"])
+                        
+                        # Log progress once per second of captured audio
+                        current_sec = int(frames * chunk_sec)
+                        if in_silence and current_sec != last_log_sec:
+                            last_log_sec = current_sec
+                            debug("%s DEBUG: Speech=%.1fs, Silence=%.1fs, Chunks=%d, "
+                                  "Speech chunks=%d", LOG_PREFIXES["progress"], frames * chunk_sec,
+                                  silence_run * chunk_sec, frames, speech_chunk_count)
+                    continue
                 else:
-                    self.logger.info(f"❌ DEBUG: Skipping processing - chunks={len(audio_chunks)}, has_speech={has_speech}")
+                    speech_chunk_count = int(count_nonzero(flags[:end]))
+                    self.logger.info("✅ DEBUG: Processing - %.1fs speech, %d speech chunks",
+                                     end * chunk_sec, speech_chunk_count)
+                
+                # Process the collected audio; frames after the endpoint start the next utterance
+                self.logger.info("🎯 DEBUG: Processing %d total chunks (%d with speech)",
+                                 end, speech_chunk_count)
+                audio_data = self._read_pcm(utterance_start, utterance_start + end)
+                utterance_start += end
+                in_silence = True
+                self._process_audio_chunk(audio_data)
+                self.logger.info("🎤 DEBUG: Starting new audio collection session")
                     
             except Exception as e:
-                self.logger.error(f"❌ DEBUG: Error in audio capture loop: {e}")
+                self.logger.error("❌ DEBUG: Error in audio capture loop: %s", e)
                 time.sleep(1)
 
 
@@ -130,18 +309,17 @@ def main():
         assistant = DebugInterviewAssistant()
         assistant.start_interview_session()
         
-        # Keep running
-        while assistant.is_running:
-            time.sleep(1)
+        # Keep running until the session stops
+        assistant._stop_event.wait()
             
     except KeyboardInterrupt:
         print("\n\n⏹️ DEBUG: Stopping debug session...")
         if 'assistant' in locals():
-            assistant.stop_interview_session()
+            assistant.shutdown()
     except Exception as e:
         print(f"❌ DEBUG: Error: {e}")
         if 'assistant' in locals():
-            assistant.stop_interview_session()
+            assistant.shutdown()
 
 
 if __name__ == "__main__":
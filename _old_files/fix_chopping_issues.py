@@ -3,30 +3,55 @@
 Quick setup and test script for the AI Interview Assistant chopping fixes.
 """
 
+import importlib.util
 import os
+import shutil
 import sys
 import subprocess
 
 
+# Importable module name -> pip package that provides it
+REQUIRED_PACKAGES = {
+    "numpy": "numpy",
+    "pyaudio": "pyaudio",
+    "openai": "openai",
+    "google.cloud.speech": "google-cloud-speech",
+}
+
+
+def _is_installed(module_name):
+    """Check if a module can be found without executing it."""
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except ModuleNotFoundError:
+        # A missing parent package (e.g. "google") raises instead of returning None
+        return False
+
+
 def check_dependencies():
     """Check if required dependencies are installed."""
-    try:
-        import numpy
-        import pyaudio
-        import openai
-        from google.cloud import speech
-        print("✅ All required dependencies are installed")
-        return True
-    except ImportError as e:
-        print(f"❌ Missing dependency: {e}")
+    missing = [name for name in REQUIRED_PACKAGES if not _is_installed(name)]
+    if missing:
+        print(f"❌ Missing dependency: {', '.join(missing)}")
         return False
+    print("✅ All required dependencies are installed")
+    return True
 
 
 def install_dependencies():
-    """Install required dependencies."""
-    print("📦 Installing required dependencies...")
+    """Install required dependencies that are not already present."""
+    missing = [package for name, package in REQUIRED_PACKAGES.items() if not _is_installed(name)]
+    if not missing:
+        print("✅ Dependencies already installed")
+        return True
+    
+    print(f"📦 Installing required dependencies: {', '.join(missing)}")
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+        # Prefer uv when available; it resolves and installs far faster than pip
+        if shutil.which("uv"):
+            subprocess.check_call(["uv", "pip", "install", "--python", sys.executable, *missing])
+        else:
+            subprocess.check_call([sys.executable, "-m", "pip", "install", *missing])
         print("✅ Dependencies installed successfully")
         return True
     except subprocess.CalledProcessError as e:
@@ -127,13 +152,17 @@ def main():
     if choice == '1':
         print("\n🎤 Starting AI Interview Assistant...")
         try:
-            subprocess.run([sys.executable, "src/main.py"])
+            # Run in-process; src/main.py imports assistant_agent as a top-level module
+            sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+            from src import main as assistant_main
+            assistant_main.main()
         except KeyboardInterrupt:
             print("\n👋 Assistant stopped")
     elif choice == '2':
         print("\n🐛 Starting DEBUG mode with detailed logging...")
         try:
-            subprocess.run([sys.executable, "debug_audio.py"])
+            import debug_audio
+            debug_audio.main()
         except KeyboardInterrupt:
             print("\n👋 Debug session stopped")
     else:
@@ -1,19 +1,57 @@
 import asyncio
+import atexit
+import collections
 import json
 import logging
+import math
 import os
+import queue
 import re
+import sys
 import threading
 import time
 from datetime import datetime
-from queue import Queue
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional, Dict, List
 
+import numpy as np
 import pyaudio
 from google.cloud import speech
-from openai import OpenAI
+from openai import AsyncOpenAI
 from dotenv import load_dotenv
 
+try:
+    import rtmixer
+    HAS_RTMIXER = True
+except ImportError:
+    HAS_RTMIXER = False
+
+# Google Cloud caps a streaming recognition call at ~305 s of audio; restart the stream before that
+STREAMING_LIMIT_SECONDS = 290
+
+# After an utterance ends, keep listening this long so a quick follow-up
+# joins the same recognize() call
+UTTERANCE_GRACE_SECONDS = 0.25
+
+# An incomplete interviewer question waits this long for the segment that completes it
+PENDING_QUESTION_SECONDS = 15.0
+
+# On stop, in-flight answers get this long to finish (and be logged) before they are cancelled
+ANSWER_DRAIN_SECONDS = 10.0
+
+# Answers kept for repeated questions, keyed on the normalized question text
+ANSWER_CACHE_SIZE = 256
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Incomplete question patterns fused into one case-insensitive search:
+# trailing preposition/conjunction/hanging "the", trailing filler, or one or two very short words
+_INCOMPLETE_RE = re.compile(
+    r'(?:\b(?:between|and|or|of|for|with|in|on|about|what\'?s|how|why|when|where|the'
+    r'|um|uh|er|umm|uhh)\s*\??\s*$)'
+    r'|(?:^\s*\w{1,2}(?:\s+\w{1,2})?\s*\??\s*$)',
+    re.IGNORECASE
+)
+
 
 class InterviewAssistant:
     """
@@ -40,36 +78,110 @@ class InterviewAssistant:
         
         # Voice activity detection - more sensitive
         self.min_audio_level = float(os.getenv('MIN_AUDIO_LEVEL', 0.005))  # More sensitive detection
+        # Compare mean squared amplitude against the squared threshold, so no sqrt is needed
+        # per chunk
+        self._min_energy_sq = (self.min_audio_level * 32767) ** 2
+        self._vad_scratch = np.empty(self.chunk_size * self.channels, dtype=np.int64)
         
         # Speaker configuration
         self.user_speaker_label = int(os.getenv('USER_SPEAKER_LABEL', 1))
         
+        # Streaming recognition sends audio as it is captured; set to false for batch
+        # recognize() per utterance
+        self.use_streaming = os.getenv('STREAMING_RECOGNITION', 'true').lower() == 'true'
+        
         # Initialize clients
         self._init_clients()
         
         # Audio stream components
         self.audio = pyaudio.PyAudio()
         self.stream = None
-        self.audio_queue = Queue()
+        # deque append/popleft are atomic, so the callback only appends and sets the wakeup event
+        self.audio_queue = collections.deque()
+        self._audio_event = threading.Event()
+        
+        # Optional rtmixer backend: PortAudio records straight into a C ring buffer, so the
+        # realtime audio thread never takes the GIL or a Python queue lock
+        backend = os.getenv('AUDIO_BACKEND', 'rtmixer').lower()
+        self.use_rtmixer = HAS_RTMIXER and backend == 'rtmixer'
+        # Input device (-1 keeps the host default) and a low PortAudio latency instead of the
+        # large default buffer
+        device_index = int(os.getenv('AUDIO_DEVICE_INDEX', -1))
+        self.input_device_index = device_index if device_index >= 0 else None
+        self.input_latency = os.getenv('AUDIO_LATENCY', 'low')
+        self.recorder = None
+        self.ringbuffer = None
+        
+        # PCM of the utterance being collected; one buffer reused for the whole session
+        self._audio_buf = bytearray()
         
         # Control flags
         self.is_running = False
-        self.conversation_log = []
+        # Set when the session stops, so callers can block on it
+        self._stop_event = threading.Event()
+        # Recent entries only; the full session is appended to a JSON Lines file as it happens
+        self.conversation_log = collections.deque(maxlen=20)
+        self._log_fh = None
+        self._log_filename = None
+        self._questions_count = 0
+        self._responses_count = 0
+        # Incomplete interviewer question waiting for its continuation, and when it was heard
+        self._pending_question = ""
+        self._pending_since = 0.0
         
         # Threading
         self.audio_thread = None
-        self.processing_thread = None
+        
+        # Identical system prefix on every request, so the provider's prompt prefix cache can
+        # reuse it
+        self._system_prompt = """You are an AI assistant helping someone during a technical interview. 
+            The user will provide you with interviewer questions, and you should give concise, 
+            professional answers that demonstrate technical knowledge. Keep responses brief but 
+            comprehensive, suitable for a live interview setting. Focus on clarity and accuracy."""
+        self._prompt_prefix = ({"role": "system", "content": self._system_prompt},)
+        self._answer_cache = collections.OrderedDict()  # LRU of normalized question -> answer
+        
+        # Per-question terminal messages, formatted once with % and written in a single call
+        self._fmt = {
+            # Cyan for partial
+            'partial': (
+                "\n\033[96m⏳ Partial question detected: %s\033[0m\n"
+                "\033[96m   Waiting for completion...\033[0m\n"
+            ),
+            'interviewer': "\n\033[94m🎙️  Interviewer: %s\033[0m\n",  # Blue for interviewer
+            # Yellow for processing
+            'processing': "\033[93m🤖 AI is processing the response...\033[0m\n",
+            'ai_prefix': "\033[92m🤖 AI Assistant: ",  # Green for AI response
+            'ai': "\033[92m🤖 AI Assistant: %s\033[0m\n\n",
+        }
+        
+        # AI answers run as tasks on a background event loop, so transcription never waits on
+        # the LLM.
+        # Each session gets a fresh loop; the OpenAI client and answer lock are created on it, since
+        # both bind to the loop they are first used on
+        self._ai_loop = None
+        self._ai_thread = None
+        self.openai_client = None
+        self._answer_lock = None  # keeps streamed answers from interleaving on stdout
     
     def _setup_logging(self):
         """Setup logging configuration."""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('interview_assistant.log'),
-                logging.StreamHandler()
-            ]
-        )
+        root = logging.getLogger()
+        if not root.handlers:
+            # Capture threads only enqueue records; file and console writes happen on the
+            # listener thread
+            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+            handlers = [logging.FileHandler('interview_assistant.log'), logging.StreamHandler()]
+            for handler in handlers:
+                handler.setFormatter(formatter)
+            
+            log_queue = queue.SimpleQueue()
+            self._log_listener = QueueListener(log_queue, *handlers)
+            self._log_listener.start()
+            atexit.register(self._log_listener.stop)
+            
+            root.setLevel(logging.INFO)
+            root.addHandler(QueueHandler(log_queue))
         self.logger = logging.getLogger(__name__)
     
     def _init_clients(self):
@@ -80,14 +192,16 @@ class InterviewAssistant:
                 raise ValueError("GOOGLE_APPLICATION_CREDENTIALS environment variable not set")
             
             self.speech_client = speech.SpeechClient()
+            # Recognition settings are fixed for the session, so build the protobufs once
+            self._recognition_config = self._build_recognition_config()
             
             # Initialize OpenAI client
-            openai_api_key = os.getenv('OPENAI_API_KEY')
-            if not openai_api_key:
+            # Validate the OpenAI key now; the async client itself is created per session on
+            # the AI loop
+            self._openai_api_key = os.getenv('OPENAI_API_KEY')
+            if not self._openai_api_key:
                 raise ValueError("OPENAI_API_KEY environment variable not set")
             
-            self.openai_client = OpenAI(api_key=openai_api_key)
-            
             self.logger.info("Successfully initialized Google Cloud Speech and OpenAI clients")
             
         except Exception as e:
@@ -102,17 +216,26 @@ class InterviewAssistant:
         
         try:
             self.is_running = True
+            self._stop_event.clear()
+            self._pending_question = ""
+            self._log_filename = f"interview_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
             self._start_audio_stream()
             
-            # Start audio capture thread
-            self.audio_thread = threading.Thread(target=self._audio_capture_loop)
+            # Start audio capture thread (streaming recognition consumes the audio queue directly)
+            if self.use_streaming:
+                capture_loop = self._streaming_recognition_loop
+            else:
+                capture_loop = self._audio_capture_loop
+            self.audio_thread = threading.Thread(target=capture_loop)
             self.audio_thread.daemon = True
             self.audio_thread.start()
             
-            # Start speech processing thread
-            self.processing_thread = threading.Thread(target=self._speech_processing_loop)
-            self.processing_thread.daemon = True
-            self.processing_thread.start()
+            # Start the event loop that streams AI answers
+            self._ai_loop = asyncio.new_event_loop()
+            self._ai_thread = threading.Thread(target=self._ai_loop.run_forever)
+            self._ai_thread.daemon = True
+            self._ai_thread.start()
+            asyncio.run_coroutine_threadsafe(self._open_ai_session(), self._ai_loop).result()
             
             self.logger.info("Interview assistant session started successfully")
             print("\n\033[95m🎤 Interview Assistant is now listening...\033[0m")  # Magenta for system status
@@ -127,27 +250,82 @@ class InterviewAssistant:
     def stop_interview_session(self):
         """Stop the interview assistant session."""
         self.is_running = False
+        self._stop_event.set()
         
         if self.stream:
             self.stream.stop_stream()
             self.stream.close()
+            self.stream = None
         
-        if self.audio:
-            self.audio.terminate()
+        if self.recorder:
+            self.recorder.stop()
+            self.recorder.close()
+            self.recorder = None
+        
+        if self._ai_loop:
+            # Let in-flight answers finish and log their exchange before the loop goes away
+            try:
+                asyncio.run_coroutine_threadsafe(self._close_ai_session(), self._ai_loop).result(
+                    timeout=ANSWER_DRAIN_SECONDS + 5
+                )
+            except Exception as e:
+                self.logger.error(f"Error closing AI session: {e}")
+            self._ai_loop.call_soon_threadsafe(self._ai_loop.stop)
+            self._ai_thread.join(timeout=2)
+            if not self._ai_thread.is_alive():
+                self._ai_loop.close()
+            self._ai_loop = None
         
         self.logger.info("Interview assistant session stopped")
         
         # Save conversation log
         self._save_conversation_log()
     
+    async def _open_ai_session(self):
+        """Create the per-session OpenAI client and answer lock on the AI loop."""
+        self._answer_lock = asyncio.Lock()
+        self.openai_client = AsyncOpenAI(api_key=self._openai_api_key)
+    
+    async def _close_ai_session(self):
+        """Drain pending answers (cancelling stragglers) and close the OpenAI client.
+        
+        Runs on the AI loop.
+        """
+        pending = asyncio.all_tasks() - {asyncio.current_task()}
+        if pending:
+            _, still_running = await asyncio.wait(pending, timeout=ANSWER_DRAIN_SECONDS)
+            for task in still_running:
+                task.cancel()
+            if still_running:
+                self.logger.warning(f"Cancelled {len(still_running)} unfinished answer(s) on stop")
+                await asyncio.gather(*still_running, return_exceptions=True)
+        
+        if self.openai_client is not None:
+            await self.openai_client.close()
+            self.openai_client = None
+    
+    def shutdown(self):
+        """Stop the session and release PortAudio; the assistant cannot be restarted afterwards."""
+        self.stop_interview_session()
+        
+        # PyAudio stays alive between sessions so restarting only reopens the stream
+        if self.audio:
+            self.audio.terminate()
+            self.audio = None
+    
     def _start_audio_stream(self):
         """Initialize and start the audio stream."""
         try:
+            if self.use_rtmixer:
+                self._start_ringbuffer_recorder()
+                return
+            
             self.stream = self.audio.open(
                 format=pyaudio.paInt16,
                 channels=self.channels,
                 rate=self.sample_rate,
                 input=True,
+                input_device_index=self.input_device_index,
                 frames_per_buffer=self.chunk_size,
                 stream_callback=self._audio_callback
             )
@@ -157,32 +335,85 @@ class InterviewAssistant:
             self.logger.error(f"Failed to start audio stream: {e}")
             raise
     
+    def _start_ringbuffer_recorder(self):
+        """Record into an rtmixer ring buffer instead of a Python stream callback."""
+        self.recorder = rtmixer.Recorder(
+            samplerate=self.sample_rate,
+            channels=self.channels,
+            blocksize=self.chunk_size,
+            dtype='int16',
+            device=self.input_device_index,
+            latency=self.input_latency
+        )
+        # Size must be a power of two frames; keep a minute of audio while an utterance is processed
+        ring_frames = 1 << math.ceil(math.log2(self.sample_rate * 60))
+        self.ringbuffer = rtmixer.RingBuffer(elementsize=2 * self.channels, size=ring_frames)
+        self.recorder.start()
+        self.recorder.record_ringbuffer(self.ringbuffer)
+    
+    def _read_audio_chunks(self, timeout: float) -> List[bytes]:
+        """Wait up to timeout for captured audio and return every complete chunk available."""
+        if self.ringbuffer is not None:
+            missing = self.chunk_size - self.ringbuffer.read_available
+            if missing > 0:
+                # The C ring has no wakeup; sleep just until the next chunk should be complete
+                time.sleep(min(timeout, missing / self.sample_rate))
+            chunks = []
+            while self.ringbuffer.read_available >= self.chunk_size:
+                chunks.append(bytes(self.ringbuffer.read(self.chunk_size)))
+            return chunks
+        
+        audio_queue = self.audio_queue
+        if not audio_queue:
+            self._audio_event.wait(timeout=timeout)
+        # Clear before draining so a chunk appended mid-drain still leaves the event set
+        self._audio_event.clear()
+        chunks = []
+        while audio_queue:
+            chunks.append(audio_queue.popleft())
+        return chunks
+    
     def _audio_callback(self, in_data, frame_count, time_info, status):
         """Callback function for audio stream."""
         if self.is_running:
-            self.audio_queue.put(in_data)
+            self.audio_queue.append(in_data)
+            self._audio_event.set()
         return (None, pyaudio.paContinue)
     
     def _has_audio_activity(self, audio_chunk: bytes) -> bool:
         """Enhanced voice activity detection based on audio level and frequency."""
         try:
-            import numpy as np
             # Convert bytes to numpy array
             audio_data = np.frombuffer(audio_chunk, dtype=np.int16)
+            n = len(audio_data)
             
-            if len(audio_data) == 0:
+            if n == 0:
                 return False
             
-            # Calculate RMS (Root Mean Square) energy
-            rms = np.sqrt(np.mean(audio_data.astype(np.float32) ** 2))
-            normalized_rms = rms / 32767.0
+            # Energy and ZCR only need coarse estimates, so run them on strided views of the chunk.
+            # Energy uses every 4th sample; ZCR uses every 2nd, which keeps its 4 kHz Nyquist above
+            # the 0.3 crossings/sample (2.4 kHz) upper bound
+            energy_samples = audio_data[::4]
+            m = len(energy_samples)
             
-            # Calculate zero crossing rate (indicates speech vs noise)
-            zero_crossings = np.sum(np.diff(np.sign(audio_data)) != 0)
-            zcr = zero_crossings / len(audio_data)
+            # Mean squared energy as one int64 dot product over a reused widened copy
+            if m <= self._vad_scratch.size:
+                wide = self._vad_scratch[:m]
+                np.copyto(wide, energy_samples)
+            else:
+                wide = energy_samples.astype(np.int64)
+            rms2 = np.dot(wide, wide) / m
+            
+            # Zero crossing rate (indicates speech vs noise): XOR of neighbours is negative on a
+            # sign flip.
+            # Halving the samples keeps the crossing count, so dividing by the full length keeps the
+            # rate in per-sample units
+            zcr_samples = audio_data[::2]
+            zero_crossings = np.count_nonzero((zcr_samples[:-1] ^ zcr_samples[1:]) < 0)
+            zcr = zero_crossings / n
             
             # Speech typically has energy above threshold AND reasonable zero crossing rate
-            has_energy = normalized_rms > self.min_audio_level
+            has_energy = rms2 > self._min_energy_sq
             has_speech_pattern = 0.01 < zcr < 0.3  # Speech typically in this range
             
             # Log detailed info occasionally for debugging
@@ -192,19 +423,13 @@ class InterviewAssistant:
                 self._debug_counter = 0
                 
             if self._debug_counter % 100 == 0:  # Log every 100 chunks
-                self.logger.debug(f"Audio analysis: RMS={normalized_rms:.4f}, ZCR={zcr:.3f}, Energy={has_energy}, Pattern={has_speech_pattern}")
+                self.logger.debug(
+                    f"Audio analysis: RMS={math.sqrt(rms2) / 32767.0:.4f}, ZCR={zcr:.3f}, "
+                    f"Energy={has_energy}, Pattern={has_speech_pattern}"
+                )
             
             return has_energy and has_speech_pattern
             
-        except ImportError:
-            # Simpler fallback without numpy
-            import struct
-            # Simple energy calculation without numpy
-            if len(audio_chunk) >= 2:
-                samples = struct.unpack(f'<{len(audio_chunk)//2}h', audio_chunk)
-                avg_energy = sum(abs(s) for s in samples) / len(samples)
-                return avg_energy > (self.min_audio_level * 32767)
-            return False
         except Exception as e:
             self.logger.error(f"Error in voice activity detection: {e}")
             return False  # Changed to False for safer behavior
@@ -214,15 +439,18 @@ class InterviewAssistant:
         while self.is_running:
             try:
                 # Collect audio chunks for processing
-                audio_chunks = []
-                start_time = time.time()
-                last_speech_time = time.time()
+                audio_buf = self._audio_buf
+                audio_buf.clear()
+                # Monotonic clock so NTP adjustments cannot distort speech/silence durations
+                start_time = time.monotonic()
+                last_speech_time = start_time
                 has_speech = False
                 silence_start_time = None
+                endpoint_time = None  # set when the utterance ended and the grace window is open
                 
                 # Continuously collect and analyze audio
                 while self.is_running:
-                    current_time = time.time()
+                    current_time = time.monotonic()
                     
                     # Check for maximum duration timeout
                     if current_time - start_time > self.max_speech_duration:
@@ -231,20 +459,36 @@ class InterviewAssistant:
                             break
                         else:
                             # No speech detected in max duration, reset and continue
-                            audio_chunks = []
+                            audio_buf.clear()
                             start_time = current_time
                             continue
                     
-                    # Get audio chunk if available
-                    if not self.audio_queue.empty():
-                        chunk = self.audio_queue.get()
-                        audio_chunks.append(chunk)
+                    # Block until audio arrives; during trailing silence wake no later than its
+                    # deadline
+                    timeout = 0.1
+                    if endpoint_time is not None:
+                        remaining = UTTERANCE_GRACE_SECONDS - (current_time - endpoint_time)
+                        timeout = max(0.0, min(remaining, 0.1))
+                    elif silence_start_time is not None:
+                        silence_so_far = current_time - silence_start_time
+                        remaining = self.final_silence_threshold - silence_so_far
+                        timeout = max(0.0, min(remaining, 0.1))
+                    chunks = self._read_audio_chunks(timeout=timeout)
+                    current_time = time.monotonic()
+                    
+                    for chunk in chunks:
+                        audio_buf.extend(chunk)
                         
                         # Check if this chunk has speech
                         if self._has_audio_activity(chunk):
                             last_speech_time = current_time
                             has_speech = True
                             silence_start_time = None  # Reset silence timer
+                            if endpoint_time is not None:
+                                self.logger.info(
+                                    "Speech resumed within grace window - coalescing utterances"
+                                )
+                                endpoint_time = None
                         else:
                             # This chunk is silence
                             if silence_start_time is None and has_speech:
@@ -254,75 +498,129 @@ class InterviewAssistant:
                     if has_speech:
                         speech_duration = current_time - start_time
                         
-                        if silence_start_time is not None:
+                        if endpoint_time is not None:
+                            # Flush once the grace window passes without new speech
+                            if current_time - endpoint_time >= UTTERANCE_GRACE_SECONDS:
+                                self.logger.info(
+                                    f"Speech complete: {speech_duration:.1f}s speech - processing"
+                                )
+                                break
+                        elif silence_start_time is not None:
                             silence_duration = current_time - silence_start_time
                             
-                            # Process if we have enough speech and sufficient final silence
+                            # End of utterance once we have enough speech and sufficient final
+                            # silence
                             if (speech_duration >= self.min_speech_duration and 
                                 silence_duration >= self.final_silence_threshold):
-                                self.logger.info(f"Speech complete: {speech_duration:.1f}s speech, {silence_duration:.1f}s silence - processing")
-                                break
-                    
-                    time.sleep(0.05)  # Small delay to prevent excessive CPU usage
+                                self.logger.debug(
+                                    f"Utterance ended after {silence_duration:.1f}s silence - "
+                                    f"waiting {UTTERANCE_GRACE_SECONDS}s for follow-up speech"
+                                )
+                                endpoint_time = current_time
                 
                 # Process the collected audio if we have speech
-                if audio_chunks and has_speech:
-                    audio_data = b''.join(audio_chunks)
-                    self._process_audio_chunk(audio_data)
+                if audio_buf and has_speech:
+                    self._process_audio_chunk(bytes(audio_buf))
                     
             except Exception as e:
                 self.logger.error(f"Error in audio capture loop: {e}")
                 time.sleep(1)
     
+    def _streaming_audio_requests(self):
+        """Yield queued audio chunks as streaming requests until the stream must be restarted."""
+        stream_start = time.monotonic()
+        while self.is_running and time.monotonic() - stream_start < STREAMING_LIMIT_SECONDS:
+            for chunk in self._read_audio_chunks(timeout=0.1):
+                yield speech.StreamingRecognizeRequest(audio_content=chunk)
+    
+    def _streaming_recognition_loop(self):
+        """Stream captured audio to Google Cloud Speech and dispatch final transcripts."""
+        streaming_config = speech.StreamingRecognitionConfig(
+            config=self._recognition_config,
+            interim_results=True,
+            single_utterance=False
+        )
+        
+        while self.is_running:
+            try:
+                responses = self.speech_client.streaming_recognize(
+                    streaming_config, self._streaming_audio_requests()
+                )
+                # With diarization every final lists all words since the stream opened; remember how
+                # many earlier finals covered so each segment is attributed by its own words
+                words_seen = 0
+                for response in responses:
+                    final_results = [result for result in response.results if result.is_final]
+                    if final_results:
+                        for result in final_results:
+                            self._process_recognition_results((result,), first_word=words_seen)
+                            if result.alternatives:
+                                words_seen = len(result.alternatives[0].words)
+                    elif response.results and response.results[0].alternatives:
+                        interim = response.results[0].alternatives[0].transcript
+                        self.logger.debug(f"Interim transcript: {interim}")
+                        
+            except Exception as e:
+                self.logger.error(f"Error in streaming recognition: {e}")
+                time.sleep(1)
+    
+    def _build_recognition_config(self):
+        """Build the recognition config shared by batch and streaming recognition.
+        
+        Called once per session.
+        """
+        # Configure recognition
+        diarization_config = speech.SpeakerDiarizationConfig(
+            enable_speaker_diarization=True,
+            min_speaker_count=1,
+            max_speaker_count=2  # Assume interviewer + interviewee
+        )
+        
+        return speech.RecognitionConfig(
+            encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+            sample_rate_hertz=self.sample_rate,
+            language_code="en-US",
+            diarization_config=diarization_config,
+            enable_automatic_punctuation=True,
+            use_enhanced=True,
+            model="latest_long",
+            # Additional settings for better conversational speech recognition
+            enable_word_time_offsets=True,
+            enable_word_confidence=True,
+            profanity_filter=False,  # Don't filter technical terms
+            speech_contexts=[
+                speech.SpeechContext(
+                    phrases=[
+                        "var let const", "JavaScript", "Python", "algorithm", 
+                        "data structure", "API", "database", "framework",
+                        "object oriented", "functional programming", "difference between"
+                    ],
+                    boost=10.0
+                )
+            ]
+        )
+    
     def _process_audio_chunk(self, audio_data: bytes):
         """Process audio chunk with Google Cloud Speech-to-Text."""
         try:
-            # Configure recognition
-            diarization_config = speech.SpeakerDiarizationConfig(
-                enable_speaker_diarization=True,
-                min_speaker_count=1,
-                max_speaker_count=2  # Assume interviewer + interviewee
-            )
-            
-            config = speech.RecognitionConfig(
-                encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
-                sample_rate_hertz=self.sample_rate,
-                language_code="en-US",
-                diarization_config=diarization_config,
-                enable_automatic_punctuation=True,
-                use_enhanced=True,
-                model="latest_long",
-                # Additional settings for better conversational speech recognition
-                enable_word_time_offsets=True,
-                enable_word_confidence=True,
-                profanity_filter=False,  # Don't filter technical terms
-                speech_contexts=[
-                    speech.SpeechContext(
-                        phrases=[
-                            "var let const", "JavaScript", "Python", "algorithm", 
-                            "data structure", "API", "database", "framework",
-                            "object oriented", "functional programming", "difference between"
-                        ],
-                        boost=10.0
-                    )
-                ]
-            )
-            
             audio = speech.RecognitionAudio(content=audio_data)
             
             # Perform recognition
-            response = self.speech_client.recognize(config=config, audio=audio)
+            response = self.speech_client.recognize(config=self._recognition_config, audio=audio)
             
             # Process results
-            self._process_recognition_results(response)
+            self._process_recognition_results(response.results)
             
         except Exception as e:
             self.logger.error(f"Error processing audio chunk: {e}")
     
-    def _process_recognition_results(self, response):
-        """Process speech recognition results and handle speaker diarization."""
+    def _process_recognition_results(self, results, first_word: int = 0):
+        """Process speech recognition results and handle speaker diarization.
+        
+        first_word is the index of the first word of the current segment in each result.
+        """
         try:
-            for result in response.results:
+            for result in results:
                 if not result.alternatives:
                     continue
                 
@@ -331,88 +629,105 @@ class InterviewAssistant:
                     continue
                 
                 # Process speaker diarization
-                speaker_info = self._extract_speaker_info(result)
+                speaker_info = self._extract_speaker_info(result, first_word)
                 
                 # Filter out user's speech - only process interviewer's questions
                 if self._is_interviewer_speech(speaker_info):
+                    # Streaming ends a segment at every short pause, so a question can arrive in
+                    # pieces; prepend the buffered start of the question unless it has gone stale
+                    if self._pending_question:
+                        if time.monotonic() - self._pending_since <= PENDING_QUESTION_SECONDS:
+                            transcript = f"{self._pending_question} {transcript}"
+                        else:
+                            self.logger.info(
+                                f"Dropping stale partial question: '{self._pending_question}'"
+                            )
+                        self._pending_question = ""
+                    
                     # Check if this looks like an incomplete question
                     if self._is_incomplete_question(transcript):
                         self.logger.info(f"Incomplete question detected: '{transcript}' - waiting for continuation")
-                        print(f"\n\033[96m⏳ Partial question detected: {transcript}\033[0m")  # Cyan for partial
-                        print("\033[96m   Waiting for completion...\033[0m")
-                        return  # Don't process incomplete questions
+                        sys.stdout.write(self._fmt['partial'] % transcript)
+                        self._pending_question = transcript
+                        self._pending_since = time.monotonic()
+                        continue  # Answered once the rest of the question arrives
                     
                     self.logger.info(f"Interviewer: {transcript}")
-                    print(f"\n\033[94m🎙️  Interviewer: {transcript}\033[0m")  # Blue for interviewer
-                    
-                    # Show processing message
-                    print("\033[93m🤖 AI is processing the response...\033[0m")  # Yellow for processing
+                    sys.stdout.write(self._fmt['interviewer'] % transcript)
                     
-                    # Generate and display AI response
-                    ai_response = self._generate_ai_response(transcript)
-                    if ai_response:
-                        print(f"\033[92m🤖 AI Assistant: {ai_response}\033[0m\n")  # Green for AI response
-                        
-                        # Log conversation
-                        self.conversation_log.append({
-                            "timestamp": datetime.now().isoformat(),
-                            "type": "interviewer_question",
-                            "text": transcript,
-                            "speaker_info": speaker_info
-                        })
-                        self.conversation_log.append({
-                            "timestamp": datetime.now().isoformat(),
-                            "type": "ai_response",
-                            "text": ai_response
-                        })
+                    # Generate the answer on the AI loop; the next utterance is transcribed
+                    # meanwhile
+                    if self._ai_loop:
+                        asyncio.run_coroutine_threadsafe(
+                            self._answer_question(transcript, speaker_info), self._ai_loop
+                        )
                 
         except Exception as e:
             self.logger.error(f"Error processing recognition results: {e}")
     
+    async def _answer_question(self, transcript: str, speaker_info: Dict):
+        """Stream the AI answer for an interviewer question and log the exchange."""
+        async with self._answer_lock:
+            # Show processing message
+            sys.stdout.write(self._fmt['processing'])
+            
+            # Generate and display AI response
+            ai_response = await self._generate_ai_response(transcript)
+            if ai_response:
+                # Log conversation
+                self._append_log_entry({
+                    "timestamp": datetime.now().isoformat(),
+                    "type": "interviewer_question",
+                    "text": transcript,
+                    "speaker_info": speaker_info
+                })
+                self._questions_count += 1
+                self._append_log_entry({
+                    "timestamp": datetime.now().isoformat(),
+                    "type": "ai_response",
+                    "text": ai_response
+                })
+                self._responses_count += 1
+    
     def _is_incomplete_question(self, text: str) -> bool:
         """Detect if a question appears to be incomplete."""
-        text_lower = text.lower().strip()
-        
-        # Common incomplete question patterns
-        incomplete_patterns = [
-            # Questions ending with prepositions or conjunctions
-            r'\b(between|and|or|of|for|with|in|on|about|what\'s|whats|how|why|when|where)\s*\??\s*$',
-            # Questions with hanging "the"
-            r'\bthe\s*\??\s*$',
-            # Very short questions (less than 3 words)
-            r'^\s*\w{1,2}(\s+\w{1,2}){0,1}\s*\??\s*$',
-            # Questions ending with "um", "uh", "er"
-            r'\b(um|uh|er|umm|uhh)\s*\??\s*$',
-        ]
-        
-        for pattern in incomplete_patterns:
-            if re.search(pattern, text_lower):
-                return True
+        text = text.strip()
+        
+        if _INCOMPLETE_RE.search(text):
+            return True
         
         # Check for very short questions that might be incomplete
-        word_count = len(text_lower.split())
-        if word_count <= 3 and not text_lower.endswith('?'):
+        word_count = len(text.split())
+        if word_count <= 3 and not text.endswith('?'):
             return True
             
         return False
     
-    def _extract_speaker_info(self, result) -> Dict:
-        """Extract speaker information from recognition result."""
+    def _extract_speaker_info(self, result, first_word: int = 0) -> Dict:
+        """Extract speaker information for the words from first_word on (the current segment)."""
         speaker_info = {"speaker_tag": None, "confidence": 0}
         
         if hasattr(result, 'alternatives') and result.alternatives:
             alternative = result.alternatives[0]
             if hasattr(alternative, 'words') and alternative.words:
-                # Get speaker tag from the first word (speaker diarization info)
-                for word in alternative.words:
-                    if hasattr(word, 'speaker_tag'):
-                        speaker_info["speaker_tag"] = word.speaker_tag
-                        break
+                words = alternative.words
+                # A result shorter than the offset is not cumulative; use all of its words
+                segment = words[first_word:] if first_word <= len(words) else words
+                
+                # One pass: the speaker tag most of the segment's words carry (0 means untagged),
+                # plus the segment's average confidence
+                tag_counts = {}
+                conf_sum = 0.0
+                for word in segment:
+                    tag = getattr(word, 'speaker_tag', 0)
+                    if tag:
+                        tag_counts[tag] = tag_counts.get(tag, 0) + 1
+                    conf_sum += getattr(word, 'confidence', 0.0)
                 
-                # Calculate average confidence
-                confidences = [word.confidence for word in alternative.words if hasattr(word, 'confidence')]
-                if confidences:
-                    speaker_info["confidence"] = sum(confidences) / len(confidences)
+                if tag_counts:
+                    speaker_info["speaker_tag"] = max(tag_counts, key=tag_counts.get)
+                if segment:
+                    speaker_info["confidence"] = conf_sum / len(segment)
         
         return speaker_info
     
@@ -427,72 +742,108 @@ class InterviewAssistant:
         # Filter out user's speech (configured speaker label)
         return speaker_tag != self.user_speaker_label
     
-    def _generate_ai_response(self, question: str) -> Optional[str]:
-        """Generate AI response using OpenAI for the interviewer's question."""
+    async def _generate_ai_response(self, question: str) -> Optional[str]:
+        """Stream an AI response from OpenAI to the terminal and return the full text."""
+        # Interviewers often repeat canonical questions; answer those without another round-trip
+        cache_key = _WHITESPACE_RE.sub(' ', question.lower().strip().rstrip('?'))
+        cached_answer = self._answer_cache.get(cache_key)
+        if cached_answer is not None:
+            self._answer_cache.move_to_end(cache_key)
+            self.logger.info(f"AI response cache hit for question: {question[:50]}...")
+            sys.stdout.write(self._fmt['ai'] % cached_answer)
+            return cached_answer
+        self.logger.debug(f"AI response cache miss for question: {question[:50]}...")
+        
+        parts = []
+        streaming = False
         try:
-            # Create a focused prompt for interview questions
-            system_prompt = """You are an AI assistant helping someone during a technical interview. 
-            The user will provide you with interviewer questions, and you should give concise, 
-            professional answers that demonstrate technical knowledge. Keep responses brief but 
-            comprehensive, suitable for a live interview setting. Focus on clarity and accuracy."""
-            
-            response = self.openai_client.chat.completions.create(
+            # Stable prefix first, per-turn question last
+            stream = await self.openai_client.chat.completions.create(
                 model="gpt-4",
                 messages=[
-                    {"role": "system", "content": system_prompt},
+                    *self._prompt_prefix,
                     {"role": "user", "content": f"Interview question: {question}"}
                 ],
                 max_tokens=300,  # Keep responses concise for real-time use
-                temperature=0.7
+                temperature=0.7,
+                stream=True,
+                stream_options={"include_usage": True}
             )
             
-            if response.choices:
-                ai_answer = response.choices[0].message.content.strip()
+            # Print tokens as they arrive so the answer starts showing before decoding finishes
+            sys.stdout.write(self._fmt['ai_prefix'])
+            streaming = True
+            async for chunk in stream:
+                if chunk.usage:
+                    # The final chunk carries usage; cached_tokens shows whether the prefix
+                    # cache hit
+                    details = chunk.usage.prompt_tokens_details
+                    cached = details.cached_tokens if details else 0
+                    self.logger.debug(
+                        f"Prompt tokens: {chunk.usage.prompt_tokens}, cached: {cached}"
+                    )
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content or ''
+                if delta:
+                    parts.append(delta)
+                    sys.stdout.write(delta)
+                    sys.stdout.flush()
+            sys.stdout.write("\033[0m\n\n")
+            sys.stdout.flush()
+            
+            ai_answer = ''.join(parts).strip()
+            if ai_answer:
                 self.logger.info(f"Generated AI response for question: {question[:50]}...")
+                self._answer_cache[cache_key] = ai_answer
+                if len(self._answer_cache) > ANSWER_CACHE_SIZE:
+                    self._answer_cache.popitem(last=False)
                 return ai_answer
             
         except Exception as e:
             self.logger.error(f"Error generating AI response: {e}")
-            return "I'm having trouble processing that question. Could you please repeat it?"
+            fallback = "I'm having trouble processing that question. Could you please repeat it?"
+            if streaming:
+                sys.stdout.write("\033[0m\n")
+            sys.stdout.write(self._fmt['ai'] % fallback)
+            return fallback
         
         return None
     
-    def _speech_processing_loop(self):
-        """Main processing loop for handling speech recognition."""
-        while self.is_running:
-            try:
-                time.sleep(0.5)  # Prevent excessive CPU usage
-            except Exception as e:
-                self.logger.error(f"Error in speech processing loop: {e}")
+    def _append_log_entry(self, entry: Dict):
+        """Append a conversation entry to the rolling window and the session's JSON Lines file."""
+        self.conversation_log.append(entry)
+        try:
+            if self._log_fh is None:
+                # Opened on the first entry so sessions without questions leave no file behind
+                self._log_fh = open(self._log_filename, 'a', encoding='utf-8', buffering=1)
+            self._log_fh.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        except Exception as e:
+            self.logger.error(f"Error writing conversation log: {e}")
     
     def _save_conversation_log(self):
-        """Save the conversation log to a file."""
-        if not self.conversation_log:
+        """Close the conversation log file; entries were already written as they happened."""
+        if self._log_fh is None:
             return
         
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"interview_log_{timestamp}.json"
+            self._log_fh.close()
+            self._log_fh = None
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(self.conversation_log, f, indent=2, ensure_ascii=False)
-            
-            self.logger.info(f"Conversation log saved to {filename}")
-            print(f"\033[95m💾 Conversation log saved to {filename}\033[0m")  # Magenta for system messages
+            self.logger.info(f"Conversation log saved to {self._log_filename}")
+            # Magenta for system messages
+            print(f"\033[95m💾 Conversation log saved to {self._log_filename}\033[0m")
             
         except Exception as e:
             self.logger.error(f"Error saving conversation log: {e}")
     
     def get_conversation_summary(self) -> Dict:
         """Get a summary of the current conversation."""
-        questions_count = len([log for log in self.conversation_log if log["type"] == "interviewer_question"])
-        responses_count = len([log for log in self.conversation_log if log["type"] == "ai_response"])
-        
         return {
-            "total_questions": questions_count,
-            "total_responses": responses_count,
+            "total_questions": self._questions_count,
+            "total_responses": self._responses_count,
             "session_duration": "active" if self.is_running else "completed",
-            "log_entries": len(self.conversation_log)
+            "log_entries": self._questions_count + self._responses_count
         }
 
 
@@ -503,13 +854,12 @@ def main():
     try:
         assistant.start_interview_session()
         
-        # Keep the main thread alive
-        while assistant.is_running:
-            time.sleep(1)
+        # Keep the main thread alive until the session stops
+        assistant._stop_event.wait()
             
     except KeyboardInterrupt:
         print("\n\n\033[93m⏹️  Stopping interview assistant...\033[0m")  # Yellow for stopping
-        assistant.stop_interview_session()
+        assistant.shutdown()
         
         # Display session summary
         summary = assistant.get_conversation_summary()
@@ -520,7 +870,7 @@ def main():
         
     except Exception as e:
         print(f"\033[91m❌ Error: {e}\033[0m")  # Red for errors
-        assistant.stop_interview_session()
+        assistant.shutdown()
 
 
 if __name__ == "__main__":
@@ -58,22 +58,20 @@ def main():
         # Start the interview session
         assistant.start_interview_session()
         
-        # Keep the application running
-        while assistant.is_running:
-            import time
-            time.sleep(1)
+        # Keep the application running until the session stops
+        assistant._stop_event.wait()
             
     except KeyboardInterrupt:
         print("\n\n\033[93m⏹️  Gracefully stopping the assistant...\033[0m")  # Yellow for stopping
         if 'assistant' in locals():
-            assistant.stop_interview_session()
+            assistant.shutdown()
         print("\033[95m👋 Goodbye!\033[0m")  # Magenta for goodbye
         
     except Exception as e:
         print(f"\033[91m❌ An error occurred: {e}\033[0m")  # Red for errors
         print("\033[97mPlease check the logs for more details.\033[0m")
         if 'assistant' in locals():
-            assistant.stop_interview_session()
+            assistant.shutdown()
         sys.exit(1)
 
 
@@ -11,11 +11,23 @@ __version__ = "0.2.0"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
-# Core imports for easy access
-from .core.interview_assistant import InterviewAssistant
+from typing import TYPE_CHECKING
+
+# Core imports for easy access. Settings is lightweight; InterviewAssistant pulls in the audio,
+# speech and AI SDKs, so it is imported on first access (PEP 562)
 from .config.settings import Settings
 
+if TYPE_CHECKING:
+    from .core.interview_assistant import InterviewAssistant
+
 __all__ = [
     "InterviewAssistant",
     "Settings",
 ]
+
+
+def __getattr__(name: str):
+    if name == "InterviewAssistant":
+        from .core.interview_assistant import InterviewAssistant
+        return InterviewAssistant
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
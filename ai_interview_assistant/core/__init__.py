@@ -1,5 +1,16 @@
 """Core functionality for AI Interview Assistant."""
 
-from .interview_assistant import InterviewAssistant
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .interview_assistant import InterviewAssistant
 
 __all__ = ["InterviewAssistant"]
+
+
+def __getattr__(name: str):
+    # Imported on first access so loading core.audio or core.speech does not pull in every service
+    if name == "InterviewAssistant":
+        from .interview_assistant import InterviewAssistant
+        return InterviewAssistant
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
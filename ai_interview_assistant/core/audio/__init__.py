@@ -1,6 +1,20 @@
 """Audio processing module."""
 
-from .audio_processor import AudioProcessor
-from .voice_activity_detector import VoiceActivityDetector
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .audio_processor import AudioProcessor
+    from .voice_activity_detector import VoiceActivityDetector
 
 __all__ = ["AudioProcessor", "VoiceActivityDetector"]
+
+
+def __getattr__(name: str):
+    # AudioProcessor needs pyaudio; import each class only when it is first used
+    if name == "AudioProcessor":
+        from .audio_processor import AudioProcessor
+        return AudioProcessor
+    if name == "VoiceActivityDetector":
+        from .voice_activity_detector import VoiceActivityDetector
+        return VoiceActivityDetector
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,9 +3,9 @@
 import logging
 import threading
 import time
-from queue import Queue
 from typing import Callable, Optional
 
+import numpy as np
 import pyaudio
 
 from .voice_activity_detector import VoiceActivityDetector
@@ -34,24 +34,49 @@ class AudioProcessor:
         self.channels = channels
         
         self.logger = logging.getLogger(__name__)
-        self.voice_detector = VoiceActivityDetector(min_audio_level)
+        # Aggregate VAD over roughly half a second of audio
+        vad_window = max(1, round(0.5 * sample_rate / chunk_size))
+        self.voice_detector = VoiceActivityDetector(min_audio_level, vad_window=vad_window)
         
-        # Audio components
-        self.audio = pyaudio.PyAudio()
+        # Audio components (PortAudio is initialized in start(), not on construction)
+        self.audio: Optional[pyaudio.PyAudio] = None
         self.stream = None
-        self.audio_queue = Queue()
+        # Captured samples land in one preallocated int16 ring (32 s, longer than any utterance),
+        # so there is no per-chunk allocation and the utterance is copied out once. _write counts
+        # samples ever written; the callback advances it only after the copy, then sets the event
+        self._chunk_samples = chunk_size * channels
+        ring_chunks = -(-(sample_rate * 32) // chunk_size)
+        self._ring = np.empty(ring_chunks * self._chunk_samples, dtype=np.int16)
+        # Persistent byte view of the ring: the callback copies PortAudio's bytes straight in, and
+        # the capture loop passes int16 slices of _ring to the VAD, so neither side creates arrays
+        self._ring_bytes = memoryview(self._ring).cast('B')
+        self._write = 0
+        self.audio_event = threading.Event()
         
         # Control flags
         self.is_running = False
-        self.audio_thread = None
         
         # Callback for processed audio
         self.audio_callback: Optional[Callable[[bytes], None]] = None
+        # Callback for every captured chunk, for consumers that stream audio as it arrives
+        self.chunk_callback: Optional[Callable[[bytes], None]] = None
+        
+        # One persistent capture thread for the processor's lifetime: it idles on _run_event between
+        # sessions and keeps _idle_event set whenever it is not inside a capture session
+        self._run_event = threading.Event()
+        self._idle_event = threading.Event()
+        self._idle_event.set()
+        self.audio_thread = threading.Thread(target=self._audio_worker, daemon=True)
+        self.audio_thread.start()
     
     def set_audio_callback(self, callback: Callable[[bytes], None]):
         """Set callback function for processed audio chunks."""
         self.audio_callback = callback
     
+    def set_chunk_callback(self, callback: Callable[[bytes], None]):
+        """Set callback function for every captured audio chunk."""
+        self.chunk_callback = callback
+    
     def start(self):
         """Start audio capture."""
         if self.is_running:
@@ -60,12 +85,11 @@ class AudioProcessor:
         
         try:
             self.is_running = True
+            self.voice_detector.reset_window()
             self._start_audio_stream()
             
-            # Start audio capture thread
-            self.audio_thread = threading.Thread(target=self._audio_capture_loop)
-            self.audio_thread.daemon = True
-            self.audio_thread.start()
+            # Wake the capture thread
+            self._run_event.set()
             
             self.logger.info("Audio processor started successfully")
             
@@ -76,20 +100,32 @@ class AudioProcessor:
     
     def stop(self):
         """Stop audio capture."""
+        self._run_event.clear()
         self.is_running = False
+        self.audio_event.set()  # wake the capture loop so it sees is_running
         
+        # Close the stream before terminating PortAudio so no callback can run against a dead instance
         if self.stream:
             self.stream.stop_stream()
             self.stream.close()
+            self.stream = None
+        
+        # Let the capture session wind down before PortAudio goes away
+        if not self._idle_event.wait(timeout=1.0):
+            self.logger.warning("Audio capture thread is still busy - stopping anyway")
         
         if self.audio:
             self.audio.terminate()
+            self.audio = None
         
         self.logger.info("Audio processor stopped")
     
     def _start_audio_stream(self):
         """Initialize and start the audio stream."""
         try:
+            if self.audio is None:
+                self.audio = pyaudio.PyAudio()
+            
             self.stream = self.audio.open(
                 format=pyaudio.paInt16,
                 channels=self.channels,
@@ -107,17 +143,84 @@ class AudioProcessor:
     def _stream_callback(self, in_data, frame_count, time_info, status):
         """Callback function for audio stream."""
         if self.is_running:
-            self.audio_queue.put(in_data)
+            ring_bytes = self._ring_bytes
+            size = self._ring.size
+            n = len(in_data) // 2
+            pos = self._write % size
+            first = min(n, size - pos)
+            ring_bytes[pos * 2:(pos + first) * 2] = in_data[:first * 2]
+            if first < n:
+                ring_bytes[:(n - first) * 2] = in_data[first * 2:n * 2]  # wrap around
+            self._write += n
+            self.audio_event.set()
         return (None, pyaudio.paContinue)
     
+    def _ring_slice(self, start: int, end: int) -> np.ndarray:
+        """Samples between two absolute ring positions (a view unless the span wraps)."""
+        size = self._ring.size
+        offset = start % size
+        length = end - start
+        if offset + length <= size:
+            return self._ring[offset:offset + length]
+        return np.concatenate((self._ring[offset:], self._ring[:offset + length - size]))
+    
+    def _audio_worker(self):
+        """Capture thread body: run one capture session each time start() sets the run event."""
+        while True:
+            self._run_event.wait()
+            self._idle_event.clear()
+            try:
+                # Without an utterance consumer there is nothing to segment, so skip VAD entirely
+                if self.audio_callback:
+                    self._audio_capture_loop()
+                else:
+                    self._chunk_forward_loop()
+            finally:
+                self._idle_event.set()
+    
+    def _chunk_forward_loop(self):
+        """Hand every captured chunk to the chunk callback, without voice activity detection."""
+        ring_size = self._ring.size
+        chunk_samples = self._chunk_samples
+        audio_event = self.audio_event
+        read = self._write  # absolute position of the next sample to forward
+        
+        while self.is_running:
+            try:
+                # Block until audio arrives (clear before reading the write position, as below)
+                if self._write - read < chunk_samples:
+                    audio_event.wait(timeout=0.1)
+                audio_event.clear()
+                write = self._write
+                
+                if write - read > ring_size:
+                    self.logger.warning("Audio capture fell behind - dropping overwritten audio")
+                    read = write - ring_size
+                
+                while write - read >= chunk_samples:
+                    chunk = self._ring_slice(read, read + chunk_samples)
+                    read += chunk_samples
+                    if self.chunk_callback:
+                        self.chunk_callback(chunk.tobytes())
+                    
+            except Exception as e:
+                self.logger.error(f"Error in audio capture loop: {e}")
+                time.sleep(1)
+    
     def _audio_capture_loop(self):
         """Main audio capture and processing loop."""
+        ring_size = self._ring.size
+        chunk_samples = self._chunk_samples
+        audio_event = self.audio_event
+        read = self._write  # absolute position of the next sample to analyze
+        
         while self.is_running:
             try:
                 # Collect audio chunks for processing
-                audio_chunks = []
-                start_time = time.time()
-                last_speech_time = time.time()
+                utterance_start = read
+                # Monotonic clock so wall-clock adjustments cannot distort durations
+                start_time = time.monotonic()
+                last_speech_time = start_time
                 has_speech = False
                 silence_start_time = None
                 
@@ -125,9 +228,51 @@ class AudioProcessor:
                 max_speech_duration = 30.0
                 final_silence_threshold = 2.5
                 
+                current_time = start_time
+                
                 # Continuously collect and analyze audio
                 while self.is_running:
-                    current_time = time.time()
+                    # During trailing silence, sleep until exactly the silence deadline unless a chunk
+                    # arrives first; otherwise re-check at least every 100 ms
+                    timeout = 0.1
+                    if silence_start_time is not None:
+                        remaining = final_silence_threshold - (current_time - silence_start_time)
+                        if remaining > 0:
+                            timeout = remaining
+                    
+                    # Block until audio arrives. Clear before reading the write position so a chunk
+                    # published meanwhile leaves the event set
+                    if self._write - read < chunk_samples:
+                        audio_event.wait(timeout=timeout)
+                    audio_event.clear()
+                    write = self._write
+                    
+                    if write - read > ring_size:
+                        # The ring lapped the reader, so the oldest audio is gone; resume at the oldest intact sample
+                        self.logger.warning("Audio capture fell behind - dropping overwritten audio")
+                        read = write - ring_size
+                    # Keep the utterance within what the ring still holds, with one chunk of slack for the writer
+                    utterance_start = max(utterance_start, write - ring_size + chunk_samples)
+                    
+                    # One clock read per iteration, taken after the wait so it dates these chunks
+                    current_time = time.monotonic()
+                    
+                    while write - read >= chunk_samples:
+                        chunk = self._ring_slice(read, read + chunk_samples)
+                        read += chunk_samples
+                        
+                        if self.chunk_callback:
+                            self.chunk_callback(chunk.tobytes())
+                        
+                        # Check if this chunk has speech
+                        if self.voice_detector.has_voice_activity_windowed(chunk):
+                            last_speech_time = current_time
+                            has_speech = True
+                            silence_start_time = None  # Reset silence timer
+                        else:
+                            # This chunk is silence
+                            if silence_start_time is None and has_speech:
+                                silence_start_time = current_time  # Start tracking silence
                     
                     # Check for maximum duration timeout
                     if current_time - start_time > max_speech_duration:
@@ -138,25 +283,10 @@ class AudioProcessor:
                             break
                         else:
                             # No speech detected in max duration, reset and continue
-                            audio_chunks = []
+                            utterance_start = read
                             start_time = current_time
                             continue
                     
-                    # Get audio chunk if available
-                    if not self.audio_queue.empty():
-                        chunk = self.audio_queue.get()
-                        audio_chunks.append(chunk)
-                        
-                        # Check if this chunk has speech
-                        if self.voice_detector.has_voice_activity(chunk):
-                            last_speech_time = current_time
-                            has_speech = True
-                            silence_start_time = None  # Reset silence timer
-                        else:
-                            # This chunk is silence
-                            if silence_start_time is None and has_speech:
-                                silence_start_time = current_time  # Start tracking silence
-                    
                     # Check if we should process accumulated speech
                     if has_speech:
                         speech_duration = current_time - start_time
@@ -172,13 +302,10 @@ class AudioProcessor:
                                     f"{silence_duration:.1f}s silence - processing"
                                 )
                                 break
-                    
-                    time.sleep(0.05)  # Small delay to prevent excessive CPU usage
                 
-                # Process the collected audio if we have speech
-                if audio_chunks and has_speech and self.audio_callback:
-                    audio_data = b''.join(audio_chunks)
-                    self.audio_callback(audio_data)
+                # Process the collected audio if we have speech (the only copy out of the ring)
+                if read > utterance_start and has_speech and self.audio_callback:
+                    self.audio_callback(self._ring_slice(utterance_start, read).tobytes())
                     
             except Exception as e:
                 self.logger.error(f"Error in audio capture loop: {e}")
@@ -2,7 +2,8 @@
 
 import logging
 import struct
-from typing import Tuple
+from collections import deque
+from typing import Dict, Optional, Tuple
 
 try:
     import numpy as np
@@ -10,73 +11,227 @@ try:
 except ImportError:
     HAS_NUMPY = False
 
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _vad_kernel(samples):
+        """Sum of squares and zero crossing count over an int16 chunk in one compiled pass.
+        
+        Args:
+            samples: int16 samples of one audio chunk
+            
+        Returns:
+            Tuple of (sum of squared samples, number of sign changes)
+        """
+        energy = 0
+        crossings = 0
+        prev = 0
+        for i in range(samples.shape[0]):
+            cur = np.int64(samples[i])
+            energy += cur * cur
+            if i > 0:
+                # Branchless sign-change test: the XOR of neighbours is negative when the signs differ
+                crossings += ((cur ^ prev) >> 63) & 1
+            prev = cur
+        return energy, crossings
+
 
 class VoiceActivityDetector:
     """Detects voice activity in audio chunks."""
     
-    def __init__(self, min_audio_level: float = 0.005):
+    def __init__(self, min_audio_level: float = 0.005, vad_stride: int = 4, vad_window: int = 8):
         """Initialize voice activity detector.
         
         Args:
-            min_audio_level: Minimum audio level to detect as speech (0.0-1.0)
+            min_audio_level: Minimum RMS level to detect as speech (0.0-1.0). It is judged on
+                the full chunk; the strided pre-check only stands in for clear silence.
+            vad_stride: Sample stride of the coarse energy pre-check (1 disables it)
+            vad_window: Number of recent chunks aggregated by has_voice_activity_windowed
         """
         self.min_audio_level = min_audio_level
+        self.vad_stride = max(1, int(vad_stride))
+        # Squared int16 threshold, so the energy gate compares mean squares without a sqrt
+        self._energy_threshold_sq = (min_audio_level * 32767) ** 2
+        # The decimated estimate is noisy, so it only stands in for chunks well below the threshold
+        self._coarse_threshold_sq = self._energy_threshold_sq * 0.5
         self.logger = logging.getLogger(__name__)
+        # Checked once: under the default INFO level the per-chunk debug bookkeeping is skipped entirely
+        self._debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
         self._debug_counter = 0
+        # Compiled unpackers for the no-numpy path, keyed by samples per chunk
+        self._struct_cache: Dict[int, struct.Struct] = {}
+        # Per-chunk (sum of squares, samples, zero crossings) over the recent window, with running
+        # totals so each chunk only adds its own stats and subtracts the one it evicts
+        self._window: deque = deque(maxlen=max(1, int(vad_window)))
+        self._window_sum_sq = 0
+        self._window_n = 0
+        self._window_zc = 0
     
-    def has_voice_activity(self, audio_chunk: bytes) -> bool:
+    def has_voice_activity(self, audio_chunk) -> bool:
         """Enhanced voice activity detection based on audio level and frequency.
         
         Args:
-            audio_chunk: Raw audio data as bytes
+            audio_chunk: Raw audio data as bytes, or an int16 numpy array
             
         Returns:
             True if voice activity is detected, False otherwise
         """
         try:
-            if HAS_NUMPY:
-                return self._detect_with_numpy(audio_chunk)
-            else:
+            if not HAS_NUMPY:
                 return self._detect_simple(audio_chunk)
+            
+            audio_data = self._as_samples(audio_chunk)
+            if len(audio_data) == 0:
+                return False
+            
+            # Crossings are not counted when the chunk's energy already fails the gate
+            stats = self._chunk_stats(audio_data, self._energy_threshold_sq)
+            return self._decide(*stats, "Audio analysis")
                 
         except Exception as e:
             self.logger.error(f"Error in voice activity detection: {e}")
             return False
     
-    def _detect_with_numpy(self, audio_chunk: bytes) -> bool:
-        """Voice activity detection using numpy for better accuracy."""
-        # Convert bytes to numpy array
-        audio_data = np.frombuffer(audio_chunk, dtype=np.int16)
+    def has_voice_activity_windowed(self, audio_chunk) -> bool:
+        """Voice activity detection over the last vad_window chunks, including this one.
+        
+        Energy and zero crossing rate are aggregated across the window, so short dips or
+        spikes inside a phrase do not flip the decision on their own.
         
-        if len(audio_data) == 0:
+        Args:
+            audio_chunk: Raw audio data as bytes, or an int16 numpy array (e.g. a view into a
+                capture ring buffer), which is used as-is without creating a new array
+            
+        Returns:
+            True if voice activity is detected across the window, False otherwise
+        """
+        try:
+            if not HAS_NUMPY:
+                return self._detect_simple(audio_chunk)
+            
+            audio_data = self._as_samples(audio_chunk)
+            if len(audio_data) == 0:
+                return False
+            
+            stats = self._chunk_stats(audio_data)
+            window = self._window
+            if len(window) == window.maxlen:
+                old_sum_sq, old_n, old_zc = window[0]
+                self._window_sum_sq -= old_sum_sq
+                self._window_n -= old_n
+                self._window_zc -= old_zc
+            window.append(stats)
+            self._window_sum_sq += stats[0]
+            self._window_n += stats[1]
+            self._window_zc += stats[2]
+            
+            return self._decide(
+                self._window_sum_sq, self._window_n, self._window_zc, "Windowed audio analysis"
+            )
+            
+        except Exception as e:
+            self.logger.error(f"Error in voice activity detection: {e}")
             return False
+    
+    def reset_window(self):
+        """Forget the aggregated window, e.g. when a new capture session starts."""
+        self._window.clear()
+        self._window_sum_sq = 0
+        self._window_n = 0
+        self._window_zc = 0
+    
+    @staticmethod
+    def _as_samples(audio_chunk):
+        """int16 samples of a chunk, reusing an array as-is and viewing bytes without a copy."""
+        if isinstance(audio_chunk, np.ndarray):
+            return audio_chunk
+        return np.frombuffer(audio_chunk, dtype=np.int16)
+    
+    def _chunk_stats(self, audio_data, zc_floor_sq: Optional[float] = None) -> Tuple[int, int, int]:
+        """Sum of squares, sample count and zero crossing count of one chunk.
+        
+        Args:
+            audio_data: int16 samples of the chunk
+            zc_floor_sq: Mean squared energy at or below which zero crossings are not counted
+                (reported as 0); None counts them for every chunk
+        """
+        n = len(audio_data)
+        
+        # Stage 1: coarse energy on every vad_stride-th sample. A clearly silent chunk reports
+        # this estimate instead of its exact energy. The compiled kernel scans the chunk once
+        # for both values, so it only gains from the pre-check when crossings can be skipped
+        if self.vad_stride > 1 and (zc_floor_sq is not None or not HAS_NUMBA):
+            coarse = audio_data[::self.vad_stride]
+            coarse_rms2 = np.einsum('i,i->', coarse, coarse, dtype=np.int64) / len(coarse)
+            if coarse_rms2 < self._coarse_threshold_sq:
+                energy = int(coarse_rms2 * n)
+                if zc_floor_sq is not None and energy / n <= zc_floor_sq:
+                    return energy, n, 0
+                return energy, n, self._zero_crossings(audio_data)
+        
+        if HAS_NUMBA:
+            energy, zero_crossings = _vad_kernel(audio_data)
+            return int(energy), n, int(zero_crossings)
+        
+        # Stage 2: mean squared energy in one int64 reduction (no float copy or squared temporary)
+        energy = np.einsum('i,i->', audio_data, audio_data, dtype=np.int64)
+        if zc_floor_sq is not None and energy / n <= zc_floor_sq:
+            return int(energy), n, 0
+        return int(energy), n, self._zero_crossings(audio_data)
+    
+    @staticmethod
+    def _zero_crossings(audio_data) -> int:
+        """Sign changes between neighbouring samples, counted from their sign bits.
         
-        # Calculate RMS (Root Mean Square) energy
-        rms = np.sqrt(np.mean(audio_data.astype(np.float32) ** 2))
-        normalized_rms = rms / 32767.0
+        Always taken on the full chunk, since decimation would alias crossings above the
+        strided Nyquist rate.
+        """
+        sign_bits = np.signbit(audio_data)
+        return int(np.count_nonzero(sign_bits[1:] ^ sign_bits[:-1]))
+    
+    def _decide(self, sum_sq: int, n: int, zero_crossings: int, label: str) -> bool:
+        """Speech decision from the energy and zero crossing totals of a chunk or window."""
+        rms2 = sum_sq / n
+        has_energy = rms2 > self._energy_threshold_sq
         
-        # Calculate zero crossing rate (indicates speech vs noise)
-        zero_crossings = np.sum(np.diff(np.sign(audio_data)) != 0)
-        zcr = zero_crossings / len(audio_data)
+        # Energy is the cheaper gate, so silent frames (the common case) skip the ZCR check
+        if not has_energy:
+            if self._debug_enabled:
+                self._debug_counter += 1
+                if self._debug_counter % 100 == 0:  # Log every 100 chunks
+                    self.logger.debug("%s: RMS=%.4f, Energy=False", label, np.sqrt(rms2) / 32767.0)
+            return False
         
         # Speech typically has energy above threshold AND reasonable zero crossing rate
-        has_energy = normalized_rms > self.min_audio_level
+        zcr = zero_crossings / n
         has_speech_pattern = 0.01 < zcr < 0.3  # Speech typically in this range
         
         # Log detailed info occasionally for debugging
-        self._debug_counter += 1
-        if self._debug_counter % 100 == 0:  # Log every 100 chunks
-            self.logger.debug(
-                f"Audio analysis: RMS={normalized_rms:.4f}, ZCR={zcr:.3f}, "
-                f"Energy={has_energy}, Pattern={has_speech_pattern}"
-            )
+        if self._debug_enabled:
+            self._debug_counter += 1
+            if self._debug_counter % 100 == 0:  # Log every 100 chunks
+                self.logger.debug(
+                    "%s: RMS=%.4f, ZCR=%.3f, Energy=%s, Pattern=%s",
+                    label, np.sqrt(rms2) / 32767.0, zcr, has_energy, has_speech_pattern
+                )
         
-        return has_energy and has_speech_pattern
+        return has_speech_pattern
     
     def _detect_simple(self, audio_chunk: bytes) -> bool:
         """Simple fallback voice activity detection without numpy."""
-        if len(audio_chunk) >= 2:
-            samples = struct.unpack(f'<{len(audio_chunk)//2}h', audio_chunk)
-            avg_energy = sum(abs(s) for s in samples) / len(samples)
+        n = len(audio_chunk) // 2
+        if n:
+            unpacker = self._struct_cache.get(n)
+            if unpacker is None:
+                unpacker = self._struct_cache[n] = struct.Struct(f'<{n}h')
+            samples = unpacker.unpack(audio_chunk[:n * 2])
+            # map(abs) keeps the accumulation in C instead of a Python-level generator
+            avg_energy = sum(map(abs, samples)) / n
             return avg_energy > (self.min_audio_level * 32767)
         return False
@@ -1,19 +1,76 @@
 """Main Interview Assistant class."""
 
+import functools
 import os
 import logging
 import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-
-from dotenv import load_dotenv
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Callable, Mapping, NamedTuple
 
 from ..config.settings import Settings
-from ..services.speech_service import SpeechService
-from ..services.ai_service import AIService
-from ..services.conversation_service import ConversationService
-from ..core.audio.audio_processor import AudioProcessor
-from ..utils.environment import EnvironmentValidator
+
+if TYPE_CHECKING:
+    from ..services.speech_service import SpeechService
+    from ..services.ai_service import AIService
+    from ..services.conversation_service import ConversationService
+    from ..core.audio.audio_processor import AudioProcessor
+
+
+# An incomplete interviewer question waits this long for the segment that completes it
+PENDING_QUESTION_SECONDS = 15.0
+
+# On stop, answers still being generated get this long to finish (and be logged) before saving
+ANSWER_DRAIN_SECONDS = 10.0
+
+# Console messages
+_STARTUP_MSG = (
+    "\033[92m✅ Assistant initialized successfully\033[0m\n"
+    "\n\033[95m🎤 Interview Assistant is now listening...\033[0m\n"
+    "\033[97m💡 Speak naturally - I'll detect the interviewer's questions and provide responses\033[0m\n"
+    "\033[97m⏹️  Press Ctrl+C to stop the session\n\033[0m"
+)
+_PARTIAL_FMT = "\n\033[96m⏳ Partial question detected: {}\033[0m\n\033[96m   Waiting for completion...\033[0m"
+_INTERVIEWER_FMT = "\n\033[94m🎙️  Interviewer: {}\033[0m"
+_PROCESSING_MSG = "\033[93m🤖 AI is processing the response...\033[0m"
+_AI_RESPONSE_PREFIX = "\033[92m🤖 AI Assistant: "
+_AI_RESPONSE_SUFFIX = "\033[0m\n"
+_AI_RESPONSE_FMT = _AI_RESPONSE_PREFIX + "{}" + _AI_RESPONSE_SUFFIX
+
+
+class LogEntry(NamedTuple):
+    """One conversation log entry."""
+    timestamp: str
+    type: str
+    text: str
+    speaker_info: Optional[Dict[str, Any]]
+
+
+@functools.cache
+def _ensure_env_loaded(env_file: str) -> None:
+    """Load a .env file into the environment, once per file.
+    
+    Args:
+        env_file: Path to the .env file
+    """
+    from dotenv import load_dotenv
+    load_dotenv(env_file)
+
+
+def _get(env: Mapping[str, str], key: str, default: Any, cast: Callable[[Any], Any]) -> Any:
+    """Read a setting from an environment snapshot and convert it.
+    
+    Args:
+        env: Snapshot of the environment variables
+        key: Variable name
+        default: Value used when the variable is not set
+        cast: Conversion applied to the raw or default value
+        
+    Returns:
+        The converted setting
+    """
+    return cast(env.get(key, default))
 
 
 class InterviewAssistant:
@@ -25,51 +82,95 @@ class InterviewAssistant:
         Args:
             config_path: Optional path to configuration file
         """
-        # Load environment variables
-        load_dotenv(config_path or Settings.ENV_FILE)
-        
-        # Validate environment
-        self.env_validator = EnvironmentValidator()
+        # Environment, configuration and services are set up on first use (see _init_services),
+        # so constructing the assistant does not import the audio, speech and AI SDKs
+        self.config_path = config_path
+        self.env_validator = None
+        self.audio_processor: Optional["AudioProcessor"] = None
+        self._speech_service: Optional["SpeechService"] = None
+        self._ai_service: Optional["AIService"] = None
+        self._conversation_service: Optional["ConversationService"] = None
         
         # Initialize logging
         self.logger = Settings.init_logging()
         
-        # Load configuration from environment
-        self._load_config()
-        
-        # Initialize services
-        self._init_services()
-        
         # Control flags
         self.is_running = False
-        self.conversation_log: List[Dict[str, Any]] = []
+        self._stop_event = threading.Event()  # set when the session stops
+        self.conversation_log: List[LogEntry] = []
+        self._q_count = 0
+        self._r_count = 0
+        # Incomplete interviewer question waiting for its continuation, and when it was heard
+        self._pending_question = ""
+        self._pending_since = 0.0
+        # Answers are generated one at a time off the recognition thread, so streaming
+        # responses keep being consumed while Ollama writes an answer. One pool per session;
+        # its single worker runs answers in order, so the last one finishing means all have
+        self._question_pool: Optional[ThreadPoolExecutor] = None
+        self._last_answer: Optional[Future] = None
     
     def _load_config(self):
         """Load configuration from environment variables."""
-        self.sample_rate = int(os.getenv('SAMPLE_RATE', 16000))
-        self.chunk_size = int(os.getenv('CHUNK_SIZE', 4096))
-        self.channels = int(os.getenv('CHANNELS', 1))
-        self.min_audio_level = float(os.getenv('MIN_AUDIO_LEVEL', 0.005))
-        self.user_speaker_label = int(os.getenv('USER_SPEAKER_LABEL', 1))
+        # Snapshot once, after load_dotenv has populated the environment
+        env = os.environ.copy()
+        self.sample_rate = _get(env, 'SAMPLE_RATE', 16000, int)
+        self.chunk_size = _get(env, 'CHUNK_SIZE', 4096, int)
+        self.channels = _get(env, 'CHANNELS', 1, int)
+        self.min_audio_level = _get(env, 'MIN_AUDIO_LEVEL', 0.005, float)
+        self.user_speaker_label = _get(env, 'USER_SPEAKER_LABEL', 1, int)
     
-    def _init_services(self):
-        """Initialize all services."""
-        try:
-            # Validate required environment variables
-            if not self.env_validator.validate_environment():
-                raise ValueError("Required environment variables are missing")
-            
-            # Initialize services
-            self.speech_service = SpeechService(
+    @property
+    def speech_service(self) -> "SpeechService":
+        """Speech recognition service, created on first access."""
+        if self._speech_service is None:
+            self._init_services()
+            from ..services.speech_service import SpeechService
+            self._speech_service = SpeechService(
                 sample_rate=self.sample_rate,
                 user_speaker_label=self.user_speaker_label
             )
+        return self._speech_service
+    
+    @property
+    def ai_service(self) -> "AIService":
+        """AI response service, created on first access."""
+        if self._ai_service is None:
+            self._init_services()
+            from ..services.ai_service import AIService
+            self._ai_service = AIService()
+        return self._ai_service
+    
+    @property
+    def conversation_service(self) -> "ConversationService":
+        """Conversation log service, created on first access."""
+        if self._conversation_service is None:
+            from ..services.conversation_service import ConversationService
+            self._conversation_service = ConversationService()
+        return self._conversation_service
+    
+    def _init_services(self):
+        """Load the environment and configuration, validate it and create the audio processor.
+        
+        Runs once; later calls return immediately.
+        """
+        if self.audio_processor is not None:
+            return
+        
+        try:
+            # Load environment variables
+            _ensure_env_loaded(str(self.config_path or Settings.ENV_FILE))
             
-            self.ai_service = AIService()
+            # Load configuration from environment
+            self._load_config()
             
-            self.conversation_service = ConversationService()
+            # Validate required environment variables
+            from ..utils.environment import EnvironmentValidator
+            self.env_validator = EnvironmentValidator()
+            if not self.env_validator.validate_environment():
+                raise ValueError("Required environment variables are missing")
             
             # Initialize audio processor
+            from ..core.audio.audio_processor import AudioProcessor
             self.audio_processor = AudioProcessor(
                 sample_rate=self.sample_rate,
                 chunk_size=self.chunk_size,
@@ -77,8 +178,8 @@ class InterviewAssistant:
                 min_audio_level=self.min_audio_level
             )
             
-            # Set audio callback
-            self.audio_processor.set_audio_callback(self._process_audio_chunk)
+            # Stream every captured chunk to speech recognition
+            self.audio_processor.set_chunk_callback(self._process_audio_chunk)
             
             self.logger.info("Successfully initialized all services")
             
@@ -86,6 +187,12 @@ class InterviewAssistant:
             self.logger.error(f"Failed to initialize services: {e}")
             raise
     
+    def _warm_up_services(self):
+        """Create the recognition and AI clients now so the first question does not pay for them."""
+        self._init_services()
+        _ = self.speech_service
+        _ = self.ai_service
+    
     def start_interview_session(self):
         """Start the interview assistant session."""
         if self.is_running:
@@ -93,7 +200,15 @@ class InterviewAssistant:
             return
         
         try:
+            self._warm_up_services()
+            
             self.is_running = True
+            self._stop_event.clear()
+            self._pending_question = ""
+            self._question_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="question")
+            
+            # Start streaming recognition before audio starts flowing into it
+            self.speech_service.start_streaming(self._handle_transcript)
             
             # Start audio processing
             self.audio_processor.start()
@@ -109,42 +224,71 @@ class InterviewAssistant:
     def stop_interview_session(self):
         """Stop the interview assistant session."""
         self.is_running = False
+        self._stop_event.set()
         
         # Stop audio processing
-        if hasattr(self, 'audio_processor'):
+        if self.audio_processor is not None:
             self.audio_processor.stop()
         
+        # Stop streaming recognition
+        if self._speech_service is not None:
+            self._speech_service.stop_streaming()
+        
+        # Let queued answers finish so they are logged and printed before the session ends
+        self._drain_answers()
+        
         self.logger.info("Interview assistant session stopped")
         
         # Save conversation log
         if self.conversation_log:
             self.conversation_service.save_conversation_log(self.conversation_log)
     
+    def _drain_answers(self):
+        """Wait up to ANSWER_DRAIN_SECONDS for queued answers, then shut down the answer pool."""
+        pool, self._question_pool = self._question_pool, None
+        if pool is None:
+            return
+        
+        last_answer, self._last_answer = self._last_answer, None
+        if last_answer is not None:
+            _, not_done = wait((last_answer,), timeout=ANSWER_DRAIN_SECONDS)
+            if not_done:
+                self.logger.warning("Answers still being generated on stop are not in the saved log")
+        pool.shutdown(wait=False, cancel_futures=True)
+    
+    def wait_until_stopped(self, timeout: Optional[float] = None) -> bool:
+        """Block until the session stops.
+        
+        Args:
+            timeout: Maximum time to wait in seconds, or None to wait indefinitely
+            
+        Returns:
+            True if the session has stopped, False if the timeout expired
+        """
+        return self._stop_event.wait(timeout)
+    
     def _process_audio_chunk(self, audio_data: bytes):
-        """Process audio chunk through speech recognition.
+        """Send a captured audio chunk to streaming speech recognition.
+        
+        Recognized segments arrive asynchronously in _handle_transcript.
         
         Args:
             audio_data: Raw audio data to process
         """
         try:
-            # Process through speech service
-            results = self.speech_service.recognize_speech(audio_data)
-            
-            for result in results:
-                self._handle_recognition_result(result)
+            self.speech_service.stream_audio(audio_data)
                 
         except Exception as e:
             self.logger.error(f"Error processing audio chunk: {e}")
     
-    def _handle_recognition_result(self, result):
-        """Handle speech recognition result.
+    def _handle_transcript(self, transcript: str, speaker_info: Dict[str, Any]):
+        """Handle a recognized transcript segment.
         
         Args:
-            result: Speech recognition result
+            transcript: Transcript of the segment
+            speaker_info: Speaker information for the segment's words
         """
         try:
-            transcript, speaker_info = self.speech_service.extract_transcript_and_speaker(result)
-            
             if not transcript:
                 return
             
@@ -152,18 +296,44 @@ class InterviewAssistant:
             if not self.speech_service.is_interviewer_speech(speaker_info):
                 return
             
+            # Streaming ends a segment at every short pause, so a question can arrive in
+            # pieces; prepend the buffered start of the question unless it has gone stale
+            if self._pending_question:
+                if time.monotonic() - self._pending_since <= PENDING_QUESTION_SECONDS:
+                    transcript = f"{self._pending_question} {transcript}"
+                else:
+                    self.logger.info(f"Dropping stale partial question: '{self._pending_question}'")
+                self._pending_question = ""
+            
             # Check if question is incomplete
             if self.speech_service.is_incomplete_question(transcript):
                 self.logger.info(f"Incomplete question detected: '{transcript}' - waiting for continuation")
                 self._print_partial_question(transcript)
+                self._pending_question = transcript
+                self._pending_since = time.monotonic()
                 return
             
-            # Process complete question
-            self._process_interviewer_question(transcript, speaker_info)
+            # Process complete question on the answer worker
+            pool = self._question_pool
+            if pool is None:
+                return
+            self._last_answer = pool.submit(self._answer_question, transcript, speaker_info)
             
         except Exception as e:
             self.logger.error(f"Error handling recognition result: {e}")
     
+    def _answer_question(self, transcript: str, speaker_info: Dict[str, Any]):
+        """Process a question on the answer worker, logging any failure.
+        
+        Args:
+            transcript: The question transcript
+            speaker_info: Speaker information from recognition
+        """
+        try:
+            self._process_interviewer_question(transcript, speaker_info)
+        except Exception as e:
+            self.logger.error(f"Error processing interviewer question: {e}")
+    
     def _process_interviewer_question(self, transcript: str, speaker_info: Dict[str, Any]):
         """Process a complete interviewer question.
         
@@ -177,26 +347,31 @@ class InterviewAssistant:
         # Show processing message
         self._print_processing_message()
         
-        # Generate AI response
-        ai_response = self.ai_service.generate_response(transcript)
+        # Generate AI response, printing tokens as they stream in
+        streamed: List[str] = []
+        
+        def on_token(token: str):
+            if not streamed:
+                print(_AI_RESPONSE_PREFIX, end="", flush=True)
+            streamed.append(token)
+            print(token, end="", flush=True)
+        
+        ai_response = self.ai_service.generate_response(transcript, on_token=on_token)
+        
+        if streamed:
+            print(_AI_RESPONSE_SUFFIX)
         
         if ai_response:
-            self._print_ai_response(ai_response)
-            
-            # Log conversation
-            self.conversation_log.extend([
-                {
-                    "timestamp": datetime.now().isoformat(),
-                    "type": "interviewer_question",
-                    "text": transcript,
-                    "speaker_info": speaker_info
-                },
-                {
-                    "timestamp": datetime.now().isoformat(),
-                    "type": "ai_response", 
-                    "text": ai_response
-                }
-            ])
+            # Fallback messages (errors, empty answers) were not streamed
+            if ai_response != "".join(streamed).strip():
+                self._print_ai_response(ai_response)
+            
+            # Log conversation (one timestamp for the question/answer pair)
+            timestamp = datetime.now().isoformat()
+            self.conversation_log.append(LogEntry(timestamp, "interviewer_question", transcript, speaker_info))
+            self.conversation_log.append(LogEntry(timestamp, "ai_response", ai_response, None))
+            self._q_count += 1
+            self._r_count += 1
     
     def get_conversation_summary(self) -> Dict[str, Any]:
         """Get a summary of the current conversation.
@@ -204,41 +379,29 @@ class InterviewAssistant:
         Returns:
             Dictionary containing conversation statistics
         """
-        questions_count = len([
-            log for log in self.conversation_log 
-            if log["type"] == "interviewer_question"
-        ])
-        responses_count = len([
-            log for log in self.conversation_log 
-            if log["type"] == "ai_response"
-        ])
-        
         return {
-            "total_questions": questions_count,
-            "total_responses": responses_count,
+            "total_questions": self._q_count,
+            "total_responses": self._r_count,
             "session_duration": "active" if self.is_running else "completed",
             "log_entries": len(self.conversation_log)
         }
     
     def _print_startup_message(self):
         """Print startup message."""
-        print("\\n\\033[95m🎤 Interview Assistant is now listening...\\033[0m")
-        print("\\033[97m💡 Speak naturally - I'll detect the interviewer's questions and provide responses\\033[0m")
-        print("\\033[97m⏹️  Press Ctrl+C to stop the session\\n\\033[0m")
+        print(_STARTUP_MSG)
     
     def _print_partial_question(self, transcript: str):
         """Print partial question message."""
-        print(f"\\n\\033[96m⏳ Partial question detected: {transcript}\\033[0m")
-        print("\\033[96m   Waiting for completion...\\033[0m")
+        print(_PARTIAL_FMT.format(transcript))
     
     def _print_interviewer_question(self, transcript: str):
         """Print interviewer question."""
-        print(f"\\n\\033[94m🎙️  Interviewer: {transcript}\\033[0m")
+        print(_INTERVIEWER_FMT.format(transcript))
     
     def _print_processing_message(self):
         """Print processing message."""
-        print("\\033[93m🤖 AI is processing the response...\\033[0m")
+        print(_PROCESSING_MSG)
     
     def _print_ai_response(self, response: str):
         """Print AI response."""
-        print(f"\\033[92m🤖 AI Assistant: {response}\\033[0m\\n")
+        print(_AI_RESPONSE_FMT.format(response))
@@ -1,6 +1,20 @@
 """Speech processing module."""
 
-from .speech_recognizer import SpeechRecognizer
-from .question_analyzer import QuestionAnalyzer
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .speech_recognizer import SpeechRecognizer
+    from .question_analyzer import QuestionAnalyzer
 
 __all__ = ["SpeechRecognizer", "QuestionAnalyzer"]
+
+
+def __getattr__(name: str):
+    # SpeechRecognizer needs google-cloud-speech; import each class only when it is first used
+    if name == "SpeechRecognizer":
+        from .speech_recognizer import SpeechRecognizer
+        return SpeechRecognizer
+    if name == "QuestionAnalyzer":
+        from .question_analyzer import QuestionAnalyzer
+        return QuestionAnalyzer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,9 +1,63 @@
 """Question analysis functionality."""
 
-import re
 from typing import Dict, Any
 
 
+# Trailing words that leave a question hanging: prepositions, conjunctions,
+# question words, a dangling "the" and fillers ("um", "uh", "er")
+_TRAIL_TOKENS = frozenset({
+    'between', 'and', 'or', 'of', 'for', 'with', 'in', 'on', 'about',
+    "what's", 'whats', 'how', 'why', 'when', 'where',
+    'the',
+    'um', 'uh', 'er', 'umm', 'uhh',
+})
+
+# Lengths of the trailing tokens, so only that many characters at the end are compared
+_TRAIL_LENGTHS = tuple(sorted({len(token) for token in _TRAIL_TOKENS}))
+
+# Characters of a short word (ASCII word characters; transcripts are lowercased en-US)
+_WORD_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz0123456789_')
+
+
+def _incomplete(text_lower: str) -> bool:
+    """Pattern checks for incomplete questions on lowercased, stripped text.
+    
+    The short-fragment check runs first in QuestionAnalyzer.is_incomplete_question.
+    Not memoized: SpeechService streams with interim_results=False, so each transcript is
+    checked once. Revisit that if interim results, which repeat growing prefixes, are enabled.
+    
+    Args:
+        text_lower: Lowercased and stripped transcript
+        
+    Returns:
+        True if the question appears incomplete, False otherwise
+    """
+    # Every check looks at the tail only: the last words, ignoring one trailing question mark
+    stripped = text_lower[:-1].rstrip() if text_lower.endswith('?') else text_lower
+    if not stripped:
+        return False
+    
+    # Only the last whitespace-separated token can end in a trailing word
+    tail = stripped.rsplit(None, 2)
+    last = tail[-1]
+    
+    # A trailing word counts if it starts at a word boundary, i.e. after a non-word character
+    # such as a hyphen, slash or apostrophe ("built-in", "and/or", "'about"); "what's" stays whole
+    for length in _TRAIL_LENGTHS:
+        if length > len(last):
+            break
+        if last[-length:] in _TRAIL_TOKENS and (
+            length == len(last) or not (last[-length - 1].isalnum() or last[-length - 1] == '_')
+        ):
+            return True
+    
+    # Very short questions (less than 3 words, each at most two characters)
+    if len(tail) <= 2 and all(len(word) <= 2 and _WORD_CHARS.issuperset(word) for word in tail):
+        return True
+        
+    return False
+
+
 class QuestionAnalyzer:
     """Analyzes speech transcripts to determine if questions are complete."""
     
@@ -24,58 +78,51 @@ class QuestionAnalyzer:
         Returns:
             True if the question appears incomplete, False otherwise
         """
-        text_lower = text.lower().strip()
-        
-        # Common incomplete question patterns
-        incomplete_patterns = [
-            # Questions ending with prepositions or conjunctions
-            r'\b(between|and|or|of|for|with|in|on|about|what\'s|whats|how|why|when|where)\s*\??\s*$',
-            # Questions with hanging "the"
-            r'\bthe\s*\??\s*$',
-            # Very short questions (less than 3 words)
-            r'^\s*\w{1,2}(\s+\w{1,2}){0,1}\s*\??\s*$',
-            # Questions ending with "um", "uh", "er"
-            r'\b(um|uh|er|umm|uhh)\s*\??\s*$',
-        ]
-        
-        for pattern in incomplete_patterns:
-            if re.search(pattern, text_lower):
-                return True
+        stripped = text.strip()
         
-        # Check for very short questions that might be incomplete
-        word_count = len(text_lower.split())
-        if word_count <= 3 and not text_lower.endswith('?'):
+        # Check for very short questions that might be incomplete; case does not matter
+        # here, so this runs before lowercasing and splits off at most four words
+        if not stripped.endswith('?') and len(stripped.split(None, 3)) <= 3:
             return True
-            
-        return False
+        
+        return _incomplete(stripped.lower())
     
-    def extract_speaker_info(self, result) -> Dict[str, Any]:
+    def extract_speaker_info(self, result, first_word: int = 0) -> Dict[str, Any]:
         """Extract speaker information from recognition result.
         
+        With speaker diarization, the top alternative of a streaming result lists every word
+        since the stream opened, so only the words from first_word on belong to the newest
+        segment.
+        
         Args:
             result: Google Cloud Speech recognition result
+            first_word: Index of the first word of the current segment
             
         Returns:
             Dictionary containing speaker information
         """
         speaker_info = {"speaker_tag": None, "confidence": 0}
         
-        if hasattr(result, 'alternatives') and result.alternatives:
-            alternative = result.alternatives[0]
-            if hasattr(alternative, 'words') and alternative.words:
-                # Get speaker tag from the first word (speaker diarization info)
-                for word in alternative.words:
-                    if hasattr(word, 'speaker_tag'):
-                        speaker_info["speaker_tag"] = word.speaker_tag
-                        break
+        # Protobuf messages always expose their declared fields, so no hasattr checks are needed
+        if result.alternatives:
+            words = result.alternatives[0].words
+            # A result shorter than the offset is not cumulative; use all of its words
+            segment = words[first_word:] if first_word <= len(words) else words
+            if segment:
+                # Speaker tag that most of the segment's words carry (0 means untagged)
+                tag_counts: Dict[int, int] = {}
+                total = 0.0
+                for word in segment:
+                    total += word.confidence
+                    tag = word.speaker_tag
+                    if tag:
+                        tag_counts[tag] = tag_counts.get(tag, 0) + 1
+                
+                if tag_counts:
+                    speaker_info["speaker_tag"] = max(tag_counts, key=tag_counts.get)
                 
-                # Calculate average confidence
-                confidences = [
-                    word.confidence for word in alternative.words 
-                    if hasattr(word, 'confidence')
-                ]
-                if confidences:
-                    speaker_info["confidence"] = sum(confidences) / len(confidences)
+                # Average confidence over the segment's words only
+                speaker_info["confidence"] = total / len(segment)
         
         return speaker_info
     
@@ -1,10 +1,53 @@
 """Speech recognition implementation using Google Cloud Speech-to-Text."""
 
+import functools
 import logging
 from typing import List, Any
 
 from google.cloud import speech
 
+# Technical vocabulary boosted during recognition, built once at import
+_SPEECH_PHRASES = (
+    "var let const", "JavaScript", "Python", "algorithm",
+    "data structure", "API", "database", "framework",
+    "object oriented", "functional programming", "difference between"
+)
+_SPEECH_CONTEXT = speech.SpeechContext(phrases=_SPEECH_PHRASES, boost=10.0)
+
+
+@functools.lru_cache(maxsize=4)
+def _build_recognition_config(sample_rate: int) -> speech.RecognitionConfig:
+    """Build the recognition config shared by SpeechRecognizer and SpeechService.
+    
+    Memoized per sample rate; callers share the returned message and must not modify it.
+    
+    Args:
+        sample_rate: Audio sample rate in Hz
+        
+    Returns:
+        RecognitionConfig with speaker diarization and boosted technical phrases
+    """
+    diarization_config = speech.SpeakerDiarizationConfig(
+        enable_speaker_diarization=True,
+        min_speaker_count=1,
+        max_speaker_count=2  # Assume interviewer + interviewee
+    )
+    
+    return speech.RecognitionConfig(
+        encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+        sample_rate_hertz=sample_rate,
+        language_code="en-US",
+        diarization_config=diarization_config,
+        enable_automatic_punctuation=True,
+        use_enhanced=True,
+        model="latest_long",
+        # Additional settings for better conversational speech recognition
+        enable_word_time_offsets=True,
+        enable_word_confidence=True,
+        profanity_filter=False,  # Don't filter technical terms
+        speech_contexts=[_SPEECH_CONTEXT]
+    )
+
 
 class SpeechRecognizer:
     """Google Cloud Speech-to-Text recognizer."""
@@ -21,6 +64,9 @@ class SpeechRecognizer:
         # Initialize Google Cloud Speech client
         self.client = speech.SpeechClient()
         
+        # Configure recognition with speaker diarization (shared; identical for every request)
+        self._recognition_config = _build_recognition_config(self.sample_rate)
+        
         self.logger.info("Speech recognizer initialized successfully")
     
     def recognize(self, audio_data: bytes) -> List[Any]:
@@ -33,38 +79,8 @@ class SpeechRecognizer:
             List of recognition results
         """
         try:
-            # Configure recognition with speaker diarization
-            diarization_config = speech.SpeakerDiarizationConfig(
-                enable_speaker_diarization=True,
-                min_speaker_count=1,
-                max_speaker_count=2
-            )
-            
-            config = speech.RecognitionConfig(
-                encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
-                sample_rate_hertz=self.sample_rate,
-                language_code="en-US",
-                diarization_config=diarization_config,
-                enable_automatic_punctuation=True,
-                use_enhanced=True,
-                model="latest_long",
-                enable_word_time_offsets=True,
-                enable_word_confidence=True,
-                profanity_filter=False,
-                speech_contexts=[
-                    speech.SpeechContext(
-                        phrases=[
-                            "JavaScript", "Python", "algorithm", "data structure",
-                            "API", "database", "framework", "object oriented",
-                            "functional programming", "difference between"
-                        ],
-                        boost=10.0
-                    )
-                ]
-            )
-            
             audio = speech.RecognitionAudio(content=audio_data)
-            response = self.client.recognize(config=config, audio=audio)
+            response = self.client.recognize(config=self._recognition_config, audio=audio)
             
             return response.results
             
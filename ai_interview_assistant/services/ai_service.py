@@ -2,9 +2,22 @@
 
 import logging
 import os
+import time
 import requests
 import json
-from typing import Optional
+from typing import Callable, FrozenSet, Optional, Tuple
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Response bodies are parsed straight from bytes (both parsers accept them, skipping the text decode)
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+# How long the list of installed Ollama models is reused before asking again
+TAGS_CACHE_TTL_SECONDS = 30.0
 
 
 class AIService:
@@ -16,6 +29,10 @@ class AIService:
         
         # Ollama configuration
         self.ollama_url = "http://localhost:11434/api/generate"
+        # One keep-alive session so every request reuses the same connection
+        self._session = requests.Session()
+        # (fetch time, model names in Ollama's order, same names as a set)
+        self._tags_cache: Optional[Tuple[float, Tuple[str, ...], FrozenSet[str]]] = None
         
         # Model selection - you can change this based on your preference
         # gemma3:1b-it-qat = fastest (~0.5-1s)
@@ -27,35 +44,55 @@ class AIService:
         self._test_ollama_connection()
         self.logger.info(f"AI service initialized successfully with model: {self.model}")
     
+    def _available_models(self) -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+        """Installed Ollama models, cached for TAGS_CACHE_TTL_SECONDS.
+        
+        Returns:
+            Tuple of (model names in Ollama's order, the same names as a set)
+        """
+        now = time.monotonic()
+        if self._tags_cache is not None and now - self._tags_cache[0] < TAGS_CACHE_TTL_SECONDS:
+            return self._tags_cache[1], self._tags_cache[2]
+        
+        response = self._session.get("http://localhost:11434/api/tags", timeout=5)
+        if response.status_code != 200:
+            raise ValueError("Ollama service not responding correctly")
+        
+        names = tuple(model['name'] for model in _json_loads(response.content).get('models', []))
+        self._tags_cache = (now, names, frozenset(names))
+        return names, self._tags_cache[2]
+    
     def _test_ollama_connection(self):
         """Test if Ollama is running and accessible."""
         try:
-            response = requests.get("http://localhost:11434/api/tags", timeout=5)
-            if response.status_code == 200:
-                models = response.json().get('models', [])
-                available_models = [model['name'] for model in models]
-                
-                if self.model not in available_models:
-                    self.logger.warning(f"Model {self.model} not found. Available: {available_models}")
-                    # Fallback to first available gemma model
-                    gemma_models = [m for m in available_models if 'gemma3' in m]
-                    if gemma_models:
-                        self.model = gemma_models[0]
-                        self.logger.info(f"Using fallback model: {self.model}")
-                    else:
-                        raise ValueError(f"No Gemma models found. Available: {available_models}")
-                        
-            else:
-                raise ValueError("Ollama service not responding correctly")
+            available_models, model_set = self._available_models()
+            
+            if self.model not in model_set:
+                self.logger.warning(f"Model {self.model} not found. Available: {list(available_models)}")
+                # Fallback to first available gemma model
+                fallback = next((m for m in available_models if 'gemma3' in m), None)
+                if fallback:
+                    self.model = fallback
+                    self.logger.info(f"Using fallback model: {self.model}")
+                else:
+                    raise ValueError(f"No Gemma models found. Available: {list(available_models)}")
                 
         except requests.exceptions.RequestException as e:
             raise ValueError(f"Cannot connect to Ollama. Make sure it's running: {e}")
     
-    def generate_response(self, question: str) -> Optional[str]:
+    def generate_response(
+        self,
+        question: str,
+        on_token: Optional[Callable[[str], None]] = None
+    ) -> Optional[str]:
         """Generate AI response for an interview question using local Ollama.
         
+        The response is streamed, so on_token sees the first words while the rest is still
+        being generated.
+        
         Args:
             question: The interviewer's question
+            on_token: Optional callback invoked with each response fragment as it arrives
             
         Returns:
             AI-generated response or None if generation fails
@@ -76,7 +113,7 @@ Answer the following interview question:"""
             payload = {
                 "model": self.model,
                 "prompt": full_prompt,
-                "stream": False,
+                "stream": True,
                 "options": {
                     "temperature": 0.7,
                     "top_p": 0.9,
@@ -85,27 +122,45 @@ Answer the following interview question:"""
                 }
             }
             
+            # Serialize the payload ourselves (orjson is faster when available)
+            body = orjson.dumps(payload) if HAS_ORJSON else json.dumps(payload).encode('utf-8')
+            
             # Make request to Ollama
-            response = requests.post(
+            with self._session.post(
                 self.ollama_url, 
-                json=payload,
-                timeout=30  # 30 second timeout
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                ai_answer = result.get('response', '').strip()
+                data=body,
+                headers={"Content-Type": "application/json"},
+                timeout=30,  # 30 second timeout
+                stream=True
+            ) as response:
                 
-                if ai_answer:
-                    self.logger.info(f"Generated AI response for question: {question[:50]}...")
-                    return ai_answer
-                else:
-                    self.logger.warning("Empty response from Ollama")
-                    return "I need a moment to process that question. Could you repeat it?"
+                if response.status_code == 200:
+                    # One JSON object per line, each carrying the next fragment of the response
+                    parts = []
+                    for line in response.iter_lines(decode_unicode=False):
+                        if not line:
+                            continue
+                        chunk = _json_loads(line)
+                        token = chunk.get('response', '')
+                        if token:
+                            parts.append(token)
+                            if on_token:
+                                on_token(token)
+                        if chunk.get('done'):
+                            break
+                    
+                    ai_answer = ''.join(parts).strip()
                     
-            else:
-                self.logger.error(f"Ollama API error: {response.status_code} - {response.text}")
-                return "I'm having trouble processing that question. Could you please repeat it?"
+                    if ai_answer:
+                        self.logger.info(f"Generated AI response for question: {question[:50]}...")
+                        return ai_answer
+                    else:
+                        self.logger.warning("Empty response from Ollama")
+                        return "I need a moment to process that question. Could you repeat it?"
+                        
+                else:
+                    self.logger.error(f"Ollama API error: {response.status_code} - {response.text}")
+                    return "I'm having trouble processing that question. Could you please repeat it?"
                 
         except requests.exceptions.Timeout:
             self.logger.error("Ollama request timed out")
@@ -2,9 +2,17 @@
 
 import json
 import logging
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import List, Dict, Any
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from ..config.settings import Settings
 
 
@@ -18,13 +26,19 @@ class ConversationService:
         # Ensure data directory exists
         Settings.DATA_DIR.mkdir(parents=True, exist_ok=True)
         
+        # Log files are written off the caller's thread; pending writes finish before exit
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="conversation-io")
+        
         self.logger.info("Conversation service initialized successfully")
     
-    def save_conversation_log(self, conversation_log: List[Dict[str, Any]]) -> str:
+    def save_conversation_log(self, conversation_log: List[Any]) -> str:
         """Save conversation log to a timestamped JSON file.
         
+        The file is written on a background thread, so this returns as soon as the
+        entries have been snapshotted; write errors are logged.
+        
         Args:
-            conversation_log: List of conversation entries
+            conversation_log: List of conversation entries, as dicts or namedtuples
             
         Returns:
             Filename of the saved log
@@ -34,15 +48,17 @@ class ConversationService:
             return ""
         
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
             filename = f"interview_log_{timestamp}.json"
             filepath = Settings.DATA_DIR / filename
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(conversation_log, f, indent=2, ensure_ascii=False)
+            # Snapshot on the caller's thread so later appends cannot race the writer
+            entries = [
+                entry._asdict() if hasattr(entry, "_asdict") else entry
+                for entry in conversation_log
+            ]
             
-            self.logger.info(f"Conversation log saved to {filename}")
-            print(f"\\033[95m💾 Conversation log saved to {filename}\\033[0m")
+            self._io_pool.submit(self._write_log, filepath, entries)
             
             return filename
             
@@ -50,6 +66,28 @@ class ConversationService:
             self.logger.error(f"Error saving conversation log: {e}")
             return ""
     
+    def _write_log(self, filepath: Path, entries: List[Dict[str, Any]]):
+        """Write conversation entries to a JSON file (runs on the I/O thread).
+        
+        Args:
+            filepath: Destination path
+            entries: Conversation entries as dicts
+        """
+        try:
+            if HAS_ORJSON:
+                # orjson writes UTF-8 bytes directly, like ensure_ascii=False
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(entries, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    json.dump(entries, f, indent=2, ensure_ascii=False)
+            
+            self.logger.info(f"Conversation log saved to {filepath.name}")
+            print(f"\\033[95m💾 Conversation log saved to {filepath.name}\\033[0m")
+            
+        except Exception as e:
+            self.logger.error(f"Error saving conversation log: {e}")
+    
     def load_conversation_log(self, filename: str) -> List[Dict[str, Any]]:
         """Load conversation log from file.
         
@@ -66,8 +104,11 @@ class ConversationService:
                 self.logger.error(f"Conversation log file not found: {filename}")
                 return []
             
-            with open(filepath, 'r', encoding='utf-8') as f:
-                conversation_log = json.load(f)
+            if HAS_ORJSON:
+                conversation_log = orjson.loads(filepath.read_bytes())
+            else:
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    conversation_log = json.load(f)
             
             self.logger.info(f"Loaded conversation log from {filename}")
             return conversation_log
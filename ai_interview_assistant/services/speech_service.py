@@ -1,11 +1,19 @@
 """Speech recognition service using Google Cloud Speech-to-Text."""
 
 import logging
-from typing import List, Tuple, Dict, Any
+import queue
+import threading
+import time
+from typing import Callable, List, Optional, Tuple, Dict, Any
 
 from google.cloud import speech
 
 from ..core.speech.question_analyzer import QuestionAnalyzer
+from ..core.speech.speech_recognizer import _build_recognition_config
+
+# Google closes a streaming recognition call after about 305 seconds, so each
+# stream is rolled over to a fresh one a little before that
+STREAMING_LIMIT_SECONDS = 290
 
 
 class SpeechService:
@@ -27,6 +35,22 @@ class SpeechService:
         # Initialize question analyzer
         self.question_analyzer = QuestionAnalyzer(user_speaker_label)
         
+        # Configure recognition (shared with SpeechRecognizer; identical for every request)
+        self._recognition_config = _build_recognition_config(self.sample_rate)
+        
+        # Streaming recognition reuses the same config; only final results are acted on, so
+        # each transcript reaches the (unmemoized) question analyzer once
+        self._streaming_config = speech.StreamingRecognitionConfig(
+            config=self._recognition_config,
+            interim_results=False
+        )
+        
+        # Streaming session state. Every start gets its own queue and stop event, handed to its
+        # thread, so a thread that outlives stop_streaming cannot read a later session's audio
+        self._audio_queue: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        self._stream_thread: Optional[threading.Thread] = None
+        self._streaming_stopped = threading.Event()
+        
         self.logger.info("Speech service initialized successfully")
     
     def recognize_speech(self, audio_data: bytes) -> List[Any]:
@@ -39,41 +63,10 @@ class SpeechService:
             List of recognition results
         """
         try:
-            # Configure recognition
-            diarization_config = speech.SpeakerDiarizationConfig(
-                enable_speaker_diarization=True,
-                min_speaker_count=1,
-                max_speaker_count=2  # Assume interviewer + interviewee
-            )
-            
-            config = speech.RecognitionConfig(
-                encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
-                sample_rate_hertz=self.sample_rate,
-                language_code="en-US",
-                diarization_config=diarization_config,
-                enable_automatic_punctuation=True,
-                use_enhanced=True,
-                model="latest_long",
-                # Additional settings for better conversational speech recognition
-                enable_word_time_offsets=True,
-                enable_word_confidence=True,
-                profanity_filter=False,  # Don't filter technical terms
-                speech_contexts=[
-                    speech.SpeechContext(
-                        phrases=[
-                            "var let const", "JavaScript", "Python", "algorithm", 
-                            "data structure", "API", "database", "framework",
-                            "object oriented", "functional programming", "difference between"
-                        ],
-                        boost=10.0
-                    )
-                ]
-            )
-            
             audio = speech.RecognitionAudio(content=audio_data)
             
             # Perform recognition
-            response = self.speech_client.recognize(config=config, audio=audio)
+            response = self.speech_client.recognize(config=self._recognition_config, audio=audio)
             
             return response.results
             
@@ -81,11 +74,115 @@ class SpeechService:
             self.logger.error(f"Error in speech recognition: {e}")
             return []
     
-    def extract_transcript_and_speaker(self, result) -> Tuple[str, Dict[str, Any]]:
+    def start_streaming(self, on_result: Callable[[str, Dict[str, Any]], None]):
+        """Start continuous streaming recognition.
+        
+        Audio passed to stream_audio is sent to Google as it is captured, so recognition
+        overlaps capture instead of waiting for a complete buffer.
+        
+        Args:
+            on_result: Callback invoked with the transcript and speaker information of
+                each final segment, on the streaming thread
+        """
+        if self._stream_thread is not None:
+            self.logger.warning("Streaming recognition is already running")
+            return
+        
+        self._audio_queue = queue.Queue()
+        self._streaming_stopped = threading.Event()
+        self._stream_thread = threading.Thread(
+            target=self._streaming_loop,
+            args=(self._audio_queue, self._streaming_stopped, on_result),
+            daemon=True
+        )
+        self._stream_thread.start()
+        self.logger.info("Streaming recognition started")
+    
+    def stream_audio(self, audio_data: bytes):
+        """Queue captured audio for the streaming recognizer.
+        
+        Args:
+            audio_data: Raw audio data as bytes
+        """
+        if self._stream_thread is not None:
+            self._audio_queue.put(audio_data)
+    
+    def stop_streaming(self):
+        """Stop streaming recognition and wait for the streaming thread to finish."""
+        thread = self._stream_thread
+        if thread is None:
+            return
+        
+        self._stream_thread = None
+        self._streaming_stopped.set()
+        self._audio_queue.put(None)  # unblock the request generator
+        thread.join(timeout=2.0)
+        if thread.is_alive():
+            self.logger.warning("Streaming thread still finishing; its results are discarded")
+        self.logger.info("Streaming recognition stopped")
+    
+    def _request_stream(self, audio_queue: "queue.Queue[Optional[bytes]]", stopped: threading.Event):
+        """Yield queued audio as streaming requests until stopped or the stream limit is reached.
+        
+        Args:
+            audio_queue: Audio queue of the streaming session this call belongs to
+            stopped: Stop event of that session
+        """
+        deadline = time.monotonic() + STREAMING_LIMIT_SECONDS
+        while not stopped.is_set():
+            audio_data = audio_queue.get()
+            if audio_data is None:
+                return
+            yield speech.StreamingRecognizeRequest(audio_content=audio_data)
+            if time.monotonic() >= deadline:
+                return
+    
+    def _streaming_loop(
+        self,
+        audio_queue: "queue.Queue[Optional[bytes]]",
+        stopped: threading.Event,
+        on_result: Callable[[str, Dict[str, Any]], None]
+    ):
+        """Run streaming recognition calls back to back until the session is stopped.
+        
+        Args:
+            audio_queue: Audio queue of this streaming session
+            stopped: Stop event of this streaming session
+            on_result: Callback for each final segment
+        """
+        while not stopped.is_set():
+            try:
+                responses = self.speech_client.streaming_recognize(
+                    config=self._streaming_config,
+                    requests=self._request_stream(audio_queue, stopped)
+                )
+                # Final results carry every word since the stream opened; track how many
+                # were already attributed so each segment is judged by its own words
+                words_seen = 0
+                for response in responses:
+                    for result in response.results:
+                        if result.is_final:
+                            transcript, speaker_info = self.extract_transcript_and_speaker(
+                                result, first_word=words_seen
+                            )
+                            if result.alternatives:
+                                words_seen = len(result.alternatives[0].words)
+                            # Segments finishing after stop belong to an ended session
+                            if stopped.is_set():
+                                return
+                            on_result(transcript, speaker_info)
+                            
+            except Exception as e:
+                self.logger.error(f"Error in streaming recognition: {e}")
+                stopped.wait(1.0)
+    
+    def extract_transcript_and_speaker(self, result, first_word: int = 0) -> Tuple[str, Dict[str, Any]]:
         """Extract transcript and speaker information from recognition result.
         
         Args:
             result: Google Cloud Speech recognition result
+            first_word: Index of the first word of the current segment (streaming results
+                list every word since the stream opened)
             
         Returns:
             Tuple of (transcript, speaker_info)
@@ -94,7 +191,7 @@ class SpeechService:
             return "", {}
         
         transcript = result.alternatives[0].transcript.strip()
-        speaker_info = self.question_analyzer.extract_speaker_info(result)
+        speaker_info = self.question_analyzer.extract_speaker_info(result, first_word)
         
         return transcript, speaker_info
     
@@ -8,7 +8,7 @@ from typing import List
 class EnvironmentValidator:
     """Validates environment setup for the application."""
     
-    REQUIRED_VARS = ['GOOGLE_APPLICATION_CREDENTIALS']  # OpenAI API key not required for Ollama
+    REQUIRED_VARS = ('GOOGLE_APPLICATION_CREDENTIALS',)  # OpenAI API key not required for Ollama
     
     def __init__(self):
         """Initialize environment validator."""
@@ -34,13 +34,8 @@ class EnvironmentValidator:
         Returns:
             List of missing variable names
         """
-        missing_vars = []
-        
-        for var in self.REQUIRED_VARS:
-            if not os.getenv(var):
-                missing_vars.append(var)
-        
-        return missing_vars
+        env = os.environ
+        return [var for var in self.REQUIRED_VARS if not env.get(var)]
     
     def _print_missing_variables(self, missing_vars: List[str]):
         """Print information about missing environment variables."""
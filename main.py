@@ -26,17 +26,15 @@ def main():
     print("\\033[97m" + "=" * 50 + "\\033[0m")
     
     try:
-        # Initialize and start the assistant
+        # Initialize and start the assistant; services are created and validated on start,
+        # which reports success once they are ready
         assistant = InterviewAssistant()
-        print("\\033[92m✅ Assistant initialized successfully\\033[0m")
         
         # Start the interview session
         assistant.start_interview_session()
         
-        # Keep the application running
-        while assistant.is_running:
-            import time
-            time.sleep(1)
+        # Keep the application running until the session stops
+        assistant.wait_until_stopped()
             
     except KeyboardInterrupt:
         print("\\n\\n\\033[93m⏹️  Gracefully stopping the assistant...\\033[0m")
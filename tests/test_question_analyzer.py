@@ -0,0 +1,53 @@
+"""Tests for incomplete-question detection."""
+
+import unittest
+
+from ai_interview_assistant.core.speech.question_analyzer import QuestionAnalyzer
+
+
+class IncompleteQuestionTest(unittest.TestCase):
+    """Cases for QuestionAnalyzer.is_incomplete_question."""
+
+    def setUp(self):
+        self.analyzer = QuestionAnalyzer()
+
+    def test_trailing_word_after_hyphen_or_slash(self):
+        for text in (
+            "What is a built-in?",
+            "Can you explain the sign-in flow for a plug-in?",
+            "Tell me about the add-on?",
+            "Should we use and/or?",
+        ):
+            with self.subTest(text=text):
+                self.assertTrue(self.analyzer.is_incomplete_question(text))
+
+    def test_trailing_word_after_space(self):
+        for text in (
+            "What is the difference between",
+            "Can you tell me more about?",
+            "Explain how the",
+            "What would you do, um",
+            "So what's",
+        ):
+            with self.subTest(text=text):
+                self.assertTrue(self.analyzer.is_incomplete_question(text))
+
+    def test_short_fragments(self):
+        for text in ("", "Tell me more", "Is it?", "ok"):
+            with self.subTest(text=text):
+                self.assertTrue(self.analyzer.is_incomplete_question(text))
+
+    def test_complete_questions(self):
+        for text in (
+            "What is the difference between var, let and const?",
+            "How would you design a rate limiter?",
+            "Tell me about a project you are proud of.",
+            "What is a closure in JavaScript?",
+            "Have you used the Python standard library?",
+        ):
+            with self.subTest(text=text):
+                self.assertFalse(self.analyzer.is_incomplete_question(text))
+
+
+if __name__ == "__main__":
+    unittest.main()